@@ -17,20 +17,26 @@ Fnos - A Python client for Fnos WebSocket communication
 """
 
 from .client import FnosClient
-from .exceptions import NotConnectedError
+from .exceptions import NotConnectedError, PermissionDenied
 from .store import Store
 from .resource_monitor import ResourceMonitor
 from .sac import SAC
 from .system_info import SystemInfo
 from .user import User
+from .user_directory import UserDirectory
 from .network import Network
 from .file import File
+from .file_index import FileIndex
 from .docker_manager import DockerManager
 from .event_logger import EventLogger
+from .event_store import EventStore
 from .share import Share
 from .notify import Notify
 from .iscsi_manager import IscsiManager
+from .timeseries import MetricBuffer, CounterRate, AnomalyDetector, ContainerStatsHistory
+from .exporter import PrometheusExporter
+from .diff import ListDiffer
 
 __version__ = "0.12.0"
 
-__all__ = ["FnosClient", "Store", "ResourceMonitor", "SAC", "SystemInfo", "User", "Network", "File", "DockerManager", "EventLogger", "Share", "Notify", "IscsiManager"]
\ No newline at end of file
+__all__ = ["FnosClient", "Store", "ResourceMonitor", "SAC", "SystemInfo", "User", "UserDirectory", "Network", "File", "FileIndex", "DockerManager", "EventLogger", "EventStore", "Share", "Notify", "IscsiManager", "MetricBuffer", "CounterRate", "AnomalyDetector", "ContainerStatsHistory", "PrometheusExporter", "ListDiffer"]
\ No newline at end of file
@@ -22,6 +22,7 @@ import hashlib
 import hmac
 import logging
 import ssl
+import re
 from Crypto.PublicKey import RSA
 from Crypto.Cipher import AES, PKCS1_v1_5
 from Crypto.Random import get_random_bytes
@@ -40,6 +41,9 @@ logging.basicConfig(
 # 创建logger实例
 logger = logging.getLogger(__name__)
 
+# 在不解析整个消息的情况下提取reqid
+_REQID_PATTERN = re.compile(r'"reqid"\s*:\s*"([^"]*)"')
+
 class FnosClient:
     def __init__(self, type: str = "main"):
         """
@@ -67,7 +71,9 @@ class FnosClient:
         self.aes_key = None
         self.iv = None
         self.pending_requests = {}  # 用于存储待处理的请求
+        self.raw_response_reqids = set()  # 需要返回原始消息（不做JSON解析）的请求
         self.on_message_callback = None  # 外部消息回调函数
+        self.push_listeners = []  # 服务器主动推送（不带reqid）消息的监听函数
         self.message_queue = asyncio.Queue()
         # 保存连接和登录信息用于重连
         self.endpoint = None
@@ -75,9 +81,15 @@ class FnosClient:
         self.password = None
         self.token = None
         self.long_token = None
+        # 当前会话是否为管理员，None表示尚未确认；重新连接或登录时失效
+        self.is_admin = None
+        self._admin_checked = False  # 本会话是否已经询问过user.isAdmin（无论能否确认）
+        self._admin_lock = asyncio.Lock()
         # SSL 配置
         self.use_ssl = False
         self.skip_ssl_verify = True
+        # 单条消息大小上限（字节），与websockets默认值一致
+        self.max_size = 2 ** 20
 
     def _generate_reqid(self):
         """生成唯一的reqid"""
@@ -191,7 +203,8 @@ class FnosClient:
             logger.error(f"解密登录secret失败: {e}")
             return None
 
-    async def connect(self, endpoint, timeout: float = 3.0, use_ssl: bool = False, skip_ssl_verify: bool = True):
+    async def connect(self, endpoint, timeout: float = 3.0, use_ssl: bool = False, skip_ssl_verify: bool = True,
+                      max_size: int = 2 ** 20):
         """连接到WebSocket服务器
         
         Args:
@@ -199,6 +212,7 @@ class FnosClient:
             timeout: 连接超时时间（秒）
             use_ssl: 是否使用 SSL/WSS 连接（默认 False）
             skip_ssl_verify: 是否跳过 SSL 证书验证（默认 True）
+            max_size: 单条消息大小上限（字节），默认为1MiB；列出超大目录时可单独为该连接调大，None表示不限制
         """
         try:
             logger.info("正在连接到WebSocket服务器...")
@@ -209,6 +223,9 @@ class FnosClient:
             self.endpoint = parsed_endpoint
             self.use_ssl = actual_use_ssl
             self.skip_ssl_verify = skip_ssl_verify
+            self.max_size = max_size
+            self.is_admin = None
+            self._admin_checked = False
             
             # 根据 use_ssl 选择协议
             protocol = "wss" if actual_use_ssl else "ws"
@@ -223,7 +240,7 @@ class FnosClient:
                     ssl_context.verify_mode = ssl.CERT_NONE
             
             # 创建WebSocket连接
-            self.ws = await websockets.connect(uri, ssl=ssl_context)
+            self.ws = await websockets.connect(uri, ssl=ssl_context, max_size=max_size)
             logger.debug("websockets.connect returned")
 
             logger.debug("Creating async message handler...")
@@ -277,8 +294,25 @@ class FnosClient:
         except Exception as e:
             logger.error(f"消息处理错误: {e}")
 
+    def _peek_reqid(self, message):
+        """不解析整个消息，直接提取其中的reqid"""
+        if not isinstance(message, str):
+            return None
+        match = _REQID_PATTERN.search(message)
+        return match.group(1) if match else None
+
     async def _process_message(self, message):
         """处理接收到的消息"""
+        # 需要原始消息的请求直接交付，避免把超大响应整体解析成dict
+        if self.raw_response_reqids:
+            reqid = self._peek_reqid(message)
+            if reqid in self.raw_response_reqids and reqid in self.pending_requests:
+                self.raw_response_reqids.discard(reqid)
+                req_data = self.pending_requests.pop(reqid)
+                if not req_data['future'].done():
+                    req_data['future'].set_result(message)
+                logger.debug(f"收到待处理请求的原始响应: {reqid}")
+                return
         try:
             data = json.loads(message)
             if "pub" in data and "reqid" in data:
@@ -348,6 +382,8 @@ class FnosClient:
                         logger.debug(f"收到待处理请求的响应: {reqid}")
                     else:
                         logger.warning(f"收到未知请求ID的响应: {reqid}")
+                elif self._dispatch_push(data):
+                    logger.debug(f"推送消息已由监听函数处理: {message}")
                 else:
                     # 检查是否有待处理的请求在等待这个响应
                     # 这里我们简单地将所有其他消息视为请求响应
@@ -411,6 +447,8 @@ class FnosClient:
         # 保存用户名和密码用于重连
         self.username = username
         self.password = password
+        self.is_admin = None
+        self._admin_checked = False
 
         # 加密登录数据
         encrypted_data = self._encrypt_login_data(username, password)
@@ -443,6 +481,8 @@ class FnosClient:
         self.token = token
         self.long_token = long_token
         self.decrypted_secret = secret
+        self.is_admin = None
+        self._admin_checked = False
 
         # 使用 token 登录
         payload = {"main": True, "token": token, "si": self.session_id}
@@ -463,6 +503,33 @@ class FnosClient:
                 self.token = response["token"]
         return response
 
+    async def check_admin(self, timeout: float = 10.0):
+        """确认当前会话是否为管理员，结果在本会话内缓存
+
+        请求失败、超时或返回结果无法识别时视为“无法确认”，同样在本会话内缓存，
+        之后不再重复询问，直到重新连接或登录。
+
+        Returns:
+            bool: 是否为管理员；无法确认时返回None
+        """
+        if self.is_admin is not None or self._admin_checked:
+            return self.is_admin
+        async with self._admin_lock:
+            if self.is_admin is None and not self._admin_checked:
+                try:
+                    response = await self.request_payload_with_response("user.isAdmin", {}, timeout)
+                except Exception as e:
+                    logger.warning(f"无法确认管理员权限: {e}")
+                else:
+                    self._update_admin(response)
+                self._admin_checked = True
+        return self.is_admin
+
+    def _update_admin(self, response):
+        """根据user.isAdmin的返回结果更新管理员状态"""
+        if isinstance(response, dict) and response.get("result") == "succ" and "admin" in response:
+            self.is_admin = bool(response["admin"])
+
     def get_decrypted_secret(self):
         """获取解密后的secret"""
         return self.decrypted_secret
@@ -471,6 +538,33 @@ class FnosClient:
         """设置消息回调函数"""
         self.on_message_callback = callback
 
+    def add_push_listener(self, listener):
+        """
+        添加服务器推送消息的监听函数
+        
+        Args:
+            listener: 接收已解析消息dict的函数，返回True表示已处理该消息，
+                此时消息不会再被当作待处理请求的响应
+        """
+        if listener not in self.push_listeners:
+            self.push_listeners.append(listener)
+
+    def remove_push_listener(self, listener):
+        """移除服务器推送消息的监听函数"""
+        if listener in self.push_listeners:
+            self.push_listeners.remove(listener)
+
+    def _dispatch_push(self, data) -> bool:
+        """将不带reqid的消息交给推送监听函数，返回是否有监听函数处理了该消息"""
+        handled = False
+        for listener in list(self.push_listeners):
+            try:
+                if listener(data):
+                    handled = True
+            except Exception as e:
+                logger.warning(f"推送消息监听函数出错: {e}")
+        return handled
+
     def _iz(self, data):
         """实现HMAC-SHA256加密函数"""
         if not self.decrypted_secret:
@@ -523,8 +617,11 @@ class FnosClient:
 
         return reqid
 
-    async def request_payload_with_response(self, req: str, payload: dict, timeout: float = 10.0):
-        """以payload为主体，添加req和reqid后发送请求，并返回响应"""
+    async def request_payload_with_response(self, req: str, payload: dict, timeout: float = 10.0, raw: bool = False):
+        """以payload为主体，添加req和reqid后发送请求，并返回响应
+
+        raw为True时返回未经JSON解析的原始消息字符串，由调用方自行增量解析
+        """
         if not self.connected:
             raise NotConnectedError("未连接到服务器")
 
@@ -538,6 +635,8 @@ class FnosClient:
             'req': req,
             'payload': payload
         }
+        if raw:
+            self.raw_response_reqids.add(reqid)
 
         # 构造请求数据
         payload_data = payload.copy()  # 创建副本避免修改原始数据
@@ -554,6 +653,8 @@ class FnosClient:
             return response
         except asyncio.TimeoutError:
             raise Exception(f"请求 {req} 超时")
+        finally:
+            self.raw_response_reqids.discard(reqid)
 
     async def reconnect(self, connect_timeout: float = 3.0, login_timeout: float = 10.0):
         """重连方法：在connected==False的前提下，先用存的endpoint做connect()，成功后用存的用户名和密码做login()"""
@@ -570,7 +671,7 @@ class FnosClient:
         logger.info("开始重连...")
 
         # 先连接（connect方法现在会等待连接完成）
-        await self.connect(self.endpoint, timeout=connect_timeout)
+        await self.connect(self.endpoint, timeout=connect_timeout, max_size=self.max_size)
 
         # 再登录
         login_result = await self.login(self.username, self.password, timeout=login_timeout)
@@ -0,0 +1,151 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+# 创建logger实例
+logger = logging.getLogger(__name__)
+
+# ListDiffer预设：(列表在响应中的路径, 标识字段, 默认忽略的字段)
+CONTAINER_LIST = (("rsp",), "Id", ("Status",))
+DISK_LIST = (("disk",), "name", ())
+INTERFACE_LIST = (("data", "net", "ifs"), "name", ())
+TARGET_LIST = (("data", "targets"), "iqn", ())
+
+
+def diff_records(previous: dict, current: list, key: str, ignore: tuple = ()) -> tuple:
+    """
+    按标识字段比较两次列表结果
+
+    Args:
+        previous: 上一次的结果，标识 -> 记录
+        current: 本次的记录列表
+        key: 标识字段名
+        ignore: 比较时忽略的字段
+
+    Returns:
+        tuple: (变化dict, 本次结果的标识 -> 记录dict)，变化dict的格式同ListDiffer.update()
+    """
+    index = {}
+    added = []
+    changed = []
+    for record in current:
+        identity = record[key]
+        index[identity] = record
+        old = previous.get(identity)
+        if old is None:
+            added.append(record)
+        elif old != record:
+            fields = {}
+            for field in old.keys() | record.keys():
+                if field in ignore:
+                    continue
+                before, after = old.get(field), record.get(field)
+                if before != after:
+                    fields[field] = (before, after)
+            if fields:
+                changed.append({"key": identity, "record": record, "fields": fields})
+    removed = [record for identity, record in previous.items() if identity not in index]
+    return {"added": added, "removed": removed, "changed": changed}, index
+
+
+class ListDiffer:
+    def __init__(self, path: tuple, key: str, ignore: tuple = ()):
+        """
+        初始化ListDiffer类
+
+        保存上一次列表结果的索引（标识 -> 记录），每次update()只产出新增、删除和变化的记录，
+        变化的记录附带具体变化的字段，下游的处理量与变化量成正比，而不是与列表长度成正比。
+
+        Args:
+            path: 列表在响应中的路径，例如("data", "net", "ifs")
+            key: 记录的标识字段，例如"Id"、"name"、"iqn"
+            ignore: 比较时忽略的字段，这些字段单独变化时不产出变化
+        """
+        self.path = tuple(path)
+        self.key = key
+        self.ignore = frozenset(ignore)
+        self.records = None
+
+    @classmethod
+    def for_containers(cls, ignore: tuple = CONTAINER_LIST[2]) -> "ListDiffer":
+        """创建用于DockerManager.list_containers()的实例（按Id，默认忽略随时间变化的Status描述）"""
+        path, key, _ = CONTAINER_LIST
+        return cls(path, key, ignore)
+
+    @classmethod
+    def for_disks(cls, ignore: tuple = DISK_LIST[2]) -> "ListDiffer":
+        """创建用于Store.list_disks()的实例（按name）"""
+        path, key, _ = DISK_LIST
+        return cls(path, key, ignore)
+
+    @classmethod
+    def for_interfaces(cls, ignore: tuple = INTERFACE_LIST[2]) -> "ListDiffer":
+        """创建用于Network.list()的实例（按接口name）"""
+        path, key, _ = INTERFACE_LIST
+        return cls(path, key, ignore)
+
+    @classmethod
+    def for_targets(cls, ignore: tuple = TARGET_LIST[2]) -> "ListDiffer":
+        """创建用于IscsiManager.list_targets()的实例（按iqn）"""
+        path, key, _ = TARGET_LIST
+        return cls(path, key, ignore)
+
+    def _extract(self, response: dict) -> list:
+        items = response
+        for field in self.path:
+            if not isinstance(items, dict) or field not in items:
+                return None
+            items = items[field]
+        return items
+
+    def update(self, response: dict) -> dict:
+        """
+        输入一次列表结果，返回与上一次相比的变化
+
+        第一次调用时所有记录都视为新增。响应中找不到列表时返回None且不更新状态。
+
+        Args:
+            response: 列表接口的返回结果
+
+        Returns:
+            dict: 变化
+            示例:
+            {
+              "added": [{...}], // 新增的记录
+              "removed": [{...}], // 删除的记录（上一次的内容）
+              "changed": [
+                {
+                  "key": "container-id",
+                  "record": {...}, // 本次的记录
+                  "fields": {"State": ("running", "exited")} // 字段 -> (旧值, 新值)
+                }
+              ]
+            }
+        """
+        items = self._extract(response)
+        if items is None:
+            logger.warning(f"列表结果缺少 {'.'.join(self.path)} 字段: {response}")
+            return None
+        changes, self.records = diff_records(self.records or {}, items, self.key, self.ignore)
+        return changes
+
+    def reset(self):
+        """清除保存的上一次结果"""
+        self.records = None
+
+    @staticmethod
+    def is_empty(changes: dict) -> bool:
+        """判断update()的结果是否没有任何变化"""
+        return not changes or not (changes["added"] or changes["removed"] or changes["changed"])
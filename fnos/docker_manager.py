@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
 from .client import FnosClient
 
@@ -19,6 +20,78 @@ from .client import FnosClient
 logger = logging.getLogger(__name__)
 
 
+class DockerInventory:
+    """
+    DockerManager.inventory()的结果：Compose项目、容器与统计信息的索引模型
+
+    Attributes:
+        composes: 项目名称 -> Compose项目信息（composeList的rsp条目）
+        containers: 容器ID -> 容器信息（containerList的rsp条目，合并stats中的cpuUsage、usedMem、networkRx、networkTx）
+        by_project: 项目名称 -> 容器信息列表，不属于任何项目的容器在空字符串下
+        by_image: 镜像名称 -> 容器信息列表
+        by_name: 容器名称（去掉开头的"/"） -> 容器信息
+        projects: 项目名称 -> 项目汇总（containers、running、cpuUsage、usedMem、networkRx、networkTx）
+    """
+
+    STAT_FIELDS = ("cpuUsage", "usedMem", "networkRx", "networkTx")
+
+    def __init__(self, composes: dict, containers: dict, stats: dict):
+        self.composes = {compose["Name"]: compose for compose in composes.get("rsp") or []}
+        self.containers = {}
+        self.by_project = {}
+        self.by_image = {}
+        self.by_name = {}
+        self.projects = {}
+
+        usage = stats.get("rsp") or {}
+        for item in containers.get("rsp") or []:
+            container = dict(item)
+            container.update(usage.get(container["Id"], {}))
+            self.containers[container["Id"]] = container
+            project = container.get("Project") or ""
+            self.by_project.setdefault(project, []).append(container)
+            self.by_image.setdefault(container.get("Image"), []).append(container)
+            for name in container.get("Names") or []:
+                self.by_name[name.lstrip("/")] = container
+
+            totals = self.projects.get(project)
+            if totals is None:
+                totals = self.projects[project] = dict.fromkeys(self.STAT_FIELDS, 0)
+                totals["containers"] = 0
+                totals["running"] = 0
+            totals["containers"] += 1
+            if container.get("State") == "running":
+                totals["running"] += 1
+            for field in self.STAT_FIELDS:
+                totals[field] += container.get(field, 0)
+
+    def container(self, key: str) -> dict:
+        """按容器ID或容器名称获取容器，不存在时返回None"""
+        return self.containers.get(key) or self.by_name.get(key.lstrip("/"))
+
+    def containers_of_project(self, project: str) -> list:
+        """获取Compose项目的容器列表"""
+        return self.by_project.get(project, [])
+
+    def containers_of_image(self, image: str) -> list:
+        """获取使用该镜像的容器列表"""
+        return self.by_image.get(image, [])
+
+    def top_projects(self, field: str = "usedMem", limit: int = None) -> list:
+        """
+        按汇总字段从大到小排列项目
+
+        Args:
+            field: 汇总字段，例如"usedMem"、"cpuUsage"，默认为"usedMem"
+            limit: 最多返回的项目数，默认为None表示全部
+
+        Returns:
+            list: (项目名称, 项目汇总)元组列表
+        """
+        ranked = sorted(self.projects.items(), key=lambda pair: pair[1][field], reverse=True)
+        return ranked if limit is None else ranked[:limit]
+
+
 class DockerManager:
     def __init__(self, client: FnosClient):
         """
@@ -137,6 +210,33 @@ class DockerManager:
         response = await self.client.request_payload_with_response("appcgi.dockermgr.stats", {}, timeout)
         return response
     
+    async def inventory(self, timeout: float = 10.0) -> DockerInventory:
+        """
+        一次获取完整的Docker清单
+        
+        并发请求composeList、containerList（含已停止的容器）和stats，
+        返回按容器ID、项目、镜像和名称建好索引、并带有项目汇总的DockerInventory。
+        
+        Args:
+            timeout: 单个请求超时时间（秒），默认为10.0秒
+            
+        Returns:
+            DockerInventory: Docker清单
+        """
+        composes, containers, stats = await asyncio.gather(
+            self.list_composes(timeout),
+            self.list_containers(True, timeout),
+            self.stats(timeout),
+        )
+        if containers.get("result") != "succ":
+            raise Exception(f"获取容器列表失败: {containers}")
+        if composes.get("result") != "succ":
+            logger.warning(f"获取Compose项目列表失败: {composes}")
+        if stats.get("result") != "succ":
+            logger.warning(f"获取容器统计信息失败: {stats}")
+        
+        return DockerInventory(composes, containers, stats)
+    
     async def get_system_settings(self, timeout: float = 10.0) -> dict:
         """
         获取Docker系统设置
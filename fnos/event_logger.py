@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import asyncio
 import logging
 from .client import FnosClient
 
@@ -29,12 +31,22 @@ class EventLogger:
         """
         self.client = client
     
-    async def common_list(self, timeout: float = 10.0) -> dict:
+    async def common_list(self, timeout: float = 10.0, offset: int = None, limit: int = None,
+                          start_time: int = None, end_time: int = None, level: int = None,
+                          module: int = None) -> dict:
         """
         获取事件日志列表
         
+        未指定的分页和过滤参数不会出现在请求中，全部不指定时与服务器默认行为一致。
+        
         Args:
             timeout: 请求超时时间（秒），默认为10.0秒
+            offset: 跳过的行数
+            limit: 最多返回的行数
+            start_time: eventtm下限（Unix时间戳，秒）
+            end_time: eventtm上限（Unix时间戳，秒）
+            level: 只返回该级别的事件
+            module: 只返回该模块的事件
             
         Returns:
             dict: 包含事件日志列表的服务器返回结果
@@ -59,5 +71,168 @@ class EventLogger:
               "req": "appcgi.eventlogger.common.list"
             }
         """
-        response = await self.client.request_payload_with_response("appcgi.eventlogger.common.list", {}, timeout)
-        return response
\ No newline at end of file
+        # 验证参数
+        if offset is not None and offset < 0:
+            raise ValueError("offset参数不能小于0")
+        if limit is not None and limit < 1:
+            raise ValueError("limit参数必须大于0")
+        
+        # 构造请求参数
+        payload = {}
+        for field, value in (
+            ("offset", offset), ("limit", limit), ("startTime", start_time),
+            ("endTime", end_time), ("level", level), ("module", module),
+        ):
+            if value is not None:
+                payload[field] = value
+        
+        response = await self.client.request_payload_with_response("appcgi.eventlogger.common.list", payload, timeout)
+        return response
+    
+    async def iter_events(self, page_size: int = 500, start_time: int = None, end_time: int = None,
+                          level: int = None, module: int = None, timeout: float = 10.0):
+        """
+        分页流式读取事件日志
+        
+        在调用方处理当前页的同时预取下一页，内存中最多同时保存两页。
+        翻页期间有新事件写入导致行偏移时，与上一页重复的事件（按id）会被跳过。
+        如果一整页都是重复的事件（服务器没有按offset/limit翻页，或两次翻页之间新写入了一整页以上的事件），
+        无法保证没有遗漏，此时抛出异常而不是当作读取结束。
+        
+        Args:
+            page_size: 每页行数，默认为500
+            start_time: eventtm下限（Unix时间戳，秒）
+            end_time: eventtm上限（Unix时间戳，秒）
+            level: 只返回该级别的事件
+            module: 只返回该模块的事件
+            timeout: 单页请求超时时间（秒），默认为10.0秒
+            
+        Yields:
+            dict: 事件，格式同common_list()返回结果data.rows中的条目
+        """
+        if page_size < 1:
+            raise ValueError("page_size参数必须大于0")
+        
+        def fetch(offset: int):
+            return asyncio.create_task(self.common_list(
+                timeout, offset=offset, limit=page_size, start_time=start_time,
+                end_time=end_time, level=level, module=module,
+            ))
+        
+        offset = 0
+        pending = fetch(offset)
+        previous_ids = set()
+        try:
+            while pending is not None:
+                response = await pending
+                pending = None
+                if response.get("result") != "succ" or "data" not in response:
+                    raise Exception(f"获取事件日志失败: {response}")
+                
+                rows = response["data"].get("rows") or []
+                total = response["data"].get("total")
+                offset += len(rows)
+                if len(rows) >= page_size and (total is None or offset < total):
+                    pending = fetch(offset)
+                
+                page_ids = {row.get("id") for row in rows}
+                if rows and page_ids <= previous_ids:
+                    # 整页都是重复的事件，继续翻页可能遗漏或无限重复
+                    raise Exception(f"事件日志翻页没有返回新的事件，offset={offset - len(rows)}")
+                for row in rows:
+                    if row.get("id") not in previous_ids:
+                        yield row
+                previous_ids = page_ids
+        finally:
+            if pending is not None:
+                pending.cancel()
+    
+    async def _newer_than(self, cursor: int, page_size: int, timeout: float) -> list:
+        """
+        从最新的事件开始向前翻页，返回id大于cursor的事件（按id升序）
+
+        只有读到不大于cursor的事件或读完整个日志时才返回；翻页中途失败（包括iter_events检测到翻页错位）时
+        直接抛出异常，不返回已读到的部分事件，避免调用方把游标移过尚未读到的事件。
+        """
+        events = {}
+        rows = self.iter_events(page_size=page_size, timeout=timeout)
+        try:
+            async for row in rows:
+                event_id = row.get("id")
+                if event_id is None:
+                    continue
+                if event_id <= cursor:
+                    break
+                events[event_id] = row
+        finally:
+            # 立即取消已预取的下一页
+            await rows.aclose()
+        return [events[event_id] for event_id in sorted(events)]
+    
+    async def tail(self, since_id: int = None, interval: float = 5.0, max_interval: float = None,
+                   cursor_path: str = None, page_size: int = 100, timeout: float = 10.0):
+        """
+        持续读取新的事件日志
+        
+        以单调递增的事件id为游标，每次轮询只翻读比游标新的页，每个事件只产出一次。
+        只有完整读到游标位置时才产出本轮的事件并移动游标；本轮翻页失败时不产出任何事件，
+        游标保持不变，下一轮重新读取。
+        没有新事件时逐步放慢轮询频率（最长max_interval），读到新事件后立即恢复为interval。
+        假定服务器按id从新到旧返回事件。
+        
+        Args:
+            since_id: 只产出id大于该值的事件；默认为None，此时先读取cursor_path中保存的游标，
+                仍没有则从当前最新的事件之后开始（获取最新事件失败时抛出异常）
+            interval: 最短轮询间隔（秒），默认为5.0秒
+            max_interval: 最长轮询间隔（秒），默认为interval的8倍
+            cursor_path: 保存游标的文件路径，每批事件产出后更新，默认为None表示不保存
+            page_size: 每次翻页的行数，默认为100
+            timeout: 单页请求超时时间（秒），默认为10.0秒
+            
+        Yields:
+            dict: 事件，格式同common_list()返回结果data.rows中的条目，按id升序产出
+        """
+        # 验证参数
+        if interval <= 0:
+            raise ValueError("interval参数必须大于0")
+        if max_interval is None:
+            max_interval = interval * 8
+        max_interval = max(max_interval, interval)
+        
+        cursor = since_id
+        if cursor is None and cursor_path and os.path.exists(cursor_path):
+            with open(cursor_path, "r", encoding="utf-8") as f:
+                content = f.read().strip()
+            if content:
+                cursor = int(content)
+        if cursor is None:
+            response = await self.common_list(timeout, offset=0, limit=1)
+            if response.get("result") != "succ" or "data" not in response:
+                # 不能退回到0，否则下一轮会重放整个日志
+                raise Exception(f"获取最新事件失败: {response}")
+            rows = response["data"].get("rows") or []
+            cursor = rows[0]["id"] if rows else 0
+        
+        current_interval = interval
+        while True:
+            try:
+                events = await self._newer_than(cursor, page_size, timeout)
+            except Exception as e:
+                # 本轮没有完整读到游标位置，保持游标不变，下一轮重新读取
+                logger.warning(f"读取新事件失败: {e}")
+                events = []
+            
+            for event in events:
+                yield event
+            
+            if events:
+                cursor = events[-1]["id"]
+                if cursor_path:
+                    temp_path = f"{cursor_path}.tmp"
+                    with open(temp_path, "w", encoding="utf-8") as f:
+                        f.write(str(cursor))
+                    os.replace(temp_path, cursor_path)
+                current_interval = interval
+            else:
+                current_interval = min(current_interval * 1.5, max_interval)
+            await asyncio.sleep(current_interval)
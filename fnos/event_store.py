@@ -0,0 +1,236 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import sqlite3
+from .client import FnosClient
+from .event_logger import EventLogger
+
+# 创建logger实例
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    eventtm INTEGER,
+    level INTEGER,
+    module INTEGER,
+    username TEXT,
+    content TEXT
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_events_eventtm ON events (eventtm);
+CREATE INDEX IF NOT EXISTS idx_events_level ON events (level);
+CREATE INDEX IF NOT EXISTS idx_events_module ON events (module);
+CREATE INDEX IF NOT EXISTS idx_events_username ON events (username);
+"""
+
+# content的全文索引，插入events时由触发器同步
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+    content, content='events', content_rowid='id', tokenize='{tokenize}'
+);
+CREATE TRIGGER IF NOT EXISTS events_fts_insert AFTER INSERT ON events BEGIN
+    INSERT INTO events_fts (rowid, content) VALUES (new.id, new.content);
+END;
+"""
+
+# trigram分词支持中文子串匹配，但要求查询词至少3个字符
+_TOKENIZERS = ("trigram", "unicode61")
+
+_COLUMNS = "id, eventtm, level, module, username, content"
+
+_GROUP_FIELDS = ("level", "module", "username")
+
+
+class EventStore:
+    def __init__(self, client: FnosClient, db_path: str):
+        """
+        初始化EventStore类
+
+        在本地SQLite数据库中保存EventLogger的事件日志，content建立FTS5全文索引，
+        eventtm、level、module、username建立普通索引。通过sync()按事件id增量同步，查询和统计完全在本地完成。
+
+        Args:
+            client: FnosClient实例
+            db_path: SQLite数据库文件路径，":memory:"表示内存数据库
+        """
+        self.client = client
+        self.event_logger = EventLogger(client)
+        self.db = sqlite3.connect(db_path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(_SCHEMA)
+        self.tokenizer = None
+        for tokenizer in _TOKENIZERS:
+            try:
+                self.db.executescript(_FTS_SCHEMA.format(tokenize=tokenizer))
+            except sqlite3.OperationalError as e:
+                logger.debug(f"无法使用FTS5分词器 {tokenizer}: {e}")
+                continue
+            self.tokenizer = tokenizer
+            break
+        if self.tokenizer is None:
+            logger.warning("当前SQLite不支持FTS5，content查询将退化为LIKE")
+        self.db.commit()
+
+    def close(self):
+        """关闭数据库连接"""
+        self.db.close()
+
+    def _meta(self, key: str) -> int:
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row is not None else None
+
+    async def sync(self, page_size: int = 1000, timeout: float = 10.0) -> dict:
+        """
+        从NAS增量同步事件日志
+
+        从最新的事件开始向前翻页，每页在一个事务中批量写入，读到上一次完整同步时的最新id为止。
+        只有读到该id或读完整个日志时，才把同步位置更新为本次读到的最新id；
+        翻页失败或错位时已读到的事件仍会写入，但同步位置保持不变并返回complete为False，
+        下次会从头补齐，已写入的事件不会重复。
+
+        Args:
+            page_size: 每页行数，默认为1000
+            timeout: 单页请求超时时间（秒），默认为10.0秒
+
+        Returns:
+            dict: 本次同步的统计
+            示例:
+            {
+              "fetched": 1200, // 读取的事件数
+              "inserted": 1180, // 新写入的事件数
+              "complete": true, // 是否完整读到上一次的同步位置或日志末尾
+              "synced_id": 1535601 // 同步位置（本次不完整时为上一次的值）
+            }
+        """
+        synced_id = self._meta("synced_id") or 0
+        newest = None
+        fetched = 0
+        inserted = 0
+        batch = []
+
+        def flush():
+            nonlocal inserted
+            if not batch:
+                return
+            with self.db:
+                cursor = self.db.executemany(
+                    f"INSERT OR IGNORE INTO events ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)", batch
+                )
+                inserted += cursor.rowcount
+            batch.clear()
+
+        complete = False
+        rows = self.event_logger.iter_events(page_size=page_size, timeout=timeout)
+        try:
+            async for row in rows:
+                event_id = row.get("id")
+                if event_id is None:
+                    continue
+                if event_id <= synced_id:
+                    complete = True
+                    break
+                if newest is None:
+                    newest = event_id
+                fetched += 1
+                batch.append((
+                    event_id, row.get("eventtm"), row.get("level"), row.get("module"),
+                    row.get("username"), row.get("content"),
+                ))
+                if len(batch) >= page_size:
+                    flush()
+            else:
+                # 读完了整个日志
+                complete = True
+        except Exception as e:
+            logger.warning(f"同步事件日志未完成: {e}")
+        finally:
+            # 立即取消已预取的下一页
+            await rows.aclose()
+        flush()
+
+        if complete and newest is not None:
+            with self.db:
+                self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('synced_id', ?)", (newest,))
+            synced_id = newest
+        return {"fetched": fetched, "inserted": inserted, "complete": complete, "synced_id": synced_id}
+
+    def _where(self, text: str, username: str, module: int, level: int,
+               since: int, until: int) -> tuple:
+        clauses = []
+        params = []
+        if text:
+            if self.tokenizer is not None and (self.tokenizer != "trigram" or len(text) >= 3):
+                clauses.append("id IN (SELECT rowid FROM events_fts WHERE events_fts MATCH ?)")
+                params.append('"' + text.replace('"', '""') + '"')
+            else:
+                clauses.append("content LIKE ? ESCAPE '\\'")
+                escaped = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+                params.append(f"%{escaped}%")
+        for column, op, value in (
+            ("username", "=", username), ("module", "=", module), ("level", "=", level),
+            ("eventtm", ">=", since), ("eventtm", "<=", until),
+        ):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def search(self, text: str = None, username: str = None, module: int = None, level: int = None,
+               since: int = None, until: int = None, limit: int = 100) -> list:
+        """
+        在本地事件库中查询事件，所有条件之间为“且”关系，结果按id从新到旧排列
+
+        Args:
+            text: content中包含的文本（使用全文索引）
+            username: 用户名
+            module: 模块
+            level: 级别
+            since: eventtm下限（含）
+            until: eventtm上限（含）
+            limit: 最多返回的事件数，默认为100
+
+        Returns:
+            list: 事件列表，每个事件为包含id、eventtm、level、module、username、content的dict
+        """
+        where, params = self._where(text, username, module, level, since, until)
+        sql = f"SELECT {_COLUMNS} FROM events{where} ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        return [dict(row) for row in self.db.execute(sql, params)]
+
+    def aggregate(self, field: str, text: str = None, username: str = None, module: int = None,
+                  level: int = None, since: int = None, until: int = None) -> dict:
+        """
+        按字段统计事件数
+
+        Args:
+            field: 分组字段，可选值为level、module、username
+            其余参数同search()
+
+        Returns:
+            dict: 字段值 -> 事件数，按事件数从多到少排列
+        """
+        if field not in _GROUP_FIELDS:
+            raise ValueError("field参数必须为level、module或username")
+        where, params = self._where(text, username, module, level, since, until)
+        sql = f"SELECT {field} AS value, COUNT(*) AS total FROM events{where} GROUP BY {field} ORDER BY total DESC"
+        return {row["value"]: row["total"] for row in self.db.execute(sql, params)}
+
+    def count(self) -> int:
+        """返回事件库中的事件总数"""
+        return self.db.execute("SELECT COUNT(*) FROM events").fetchone()[0]
@@ -1,3 +1,8 @@
 class NotConnectedError(Exception):
     """当FnosClient未连接到服务器时抛出的异常"""
+    pass
+
+
+class PermissionDenied(Exception):
+    """当前用户没有权限调用该接口时抛出的异常"""
     pass
\ No newline at end of file
@@ -0,0 +1,334 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import asyncio
+import logging
+from .client import FnosClient
+from .resource_monitor import ResourceMonitor
+from .store import Store
+from .docker_manager import DockerManager
+from .sac import SAC
+from .notify import Notify
+
+# 创建logger实例
+logger = logging.getLogger(__name__)
+
+# 各指标族默认刷新间隔（秒）
+DEFAULT_INTERVALS = {
+    "resmon": 5.0,
+    "store": 60.0,
+    "docker": 15.0,
+    "ups": 10.0,
+    "notify": 30.0,
+}
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value) -> str:
+    """转义标签值"""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _number(value):
+    """将数值或数值字符串转换为float，无法转换时返回None"""
+    if isinstance(value, bool):
+        return 1.0 if value else 0.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class _Family:
+    """一个指标族的文本渲染器"""
+
+    def __init__(self):
+        self.lines = []
+        self._declared = set()
+
+    def add(self, name: str, help: str, value, labels: dict = None, type: str = "gauge"):
+        value = _number(value)
+        if value is None:
+            return
+        if name not in self._declared:
+            self._declared.add(name)
+            self.lines.append(f"# HELP {name} {help}")
+            self.lines.append(f"# TYPE {name} {type}")
+        if labels:
+            label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+            self.lines.append(f"{name}{{{label_text}}} {value!r}")
+        else:
+            self.lines.append(f"{name} {value!r}")
+
+    def render(self) -> bytes:
+        return ("\n".join(self.lines) + "\n").encode("utf-8") if self.lines else b""
+
+
+class PrometheusExporter:
+    def __init__(self, client: FnosClient, intervals: dict = None, timeout: float = 10.0):
+        """
+        初始化PrometheusExporter类
+
+        基于一个持久会话，按各自的刷新间隔在后台并发采集ResourceMonitor、Store、DockerManager.stats、
+        SAC.ups_status和Notify.unread_total，并预先渲染为Prometheus文本格式。
+        /metrics请求直接返回已渲染好的内容，不会等待NAS。
+
+        会话断开时只由一个指标族调用FnosClient.reconnect()，重连期间其他指标族跳过本轮并标记为不可用。
+        reconnect()依赖login()保存的用户名和密码，通过login_via_token()登录的会话无法自动重连，
+        断开后各指标族的fnos_exporter_up保持为0，需要调用方自行重新连接并登录。
+
+        Args:
+            client: 已登录的FnosClient实例
+            intervals: 指标族 -> 刷新间隔（秒），可用的指标族为resmon、store、docker、ups、notify；
+                未指定的使用默认间隔，间隔为None或0表示不采集该指标族
+            timeout: 单次请求超时时间（秒），默认为10.0秒
+        """
+        self.client = client
+        self.timeout = timeout
+        self.intervals = dict(DEFAULT_INTERVALS)
+        if intervals:
+            for family in intervals:
+                if family not in DEFAULT_INTERVALS:
+                    raise ValueError(f"不支持的指标族: {family}")
+            self.intervals.update(intervals)
+        self.intervals = {family: interval for family, interval in self.intervals.items() if interval}
+
+        self.resource_monitor = ResourceMonitor(client)
+        self.store = Store(client)
+        self.docker_manager = DockerManager(client)
+        self.sac = SAC(client)
+        self.notify = Notify(client)
+
+        self._collectors = {
+            "resmon": self._collect_resmon,
+            "store": self._collect_store,
+            "docker": self._collect_docker,
+            "ups": self._collect_ups,
+            "notify": self._collect_notify,
+        }
+        self._fragments = {family: b"" for family in self.intervals}
+        self._up = {family: 0 for family in self.intervals}
+        self._last_success = {family: 0.0 for family in self.intervals}
+        self._durations = {family: 0.0 for family in self.intervals}
+        self._payload = b""
+        self._reconnect_lock = asyncio.Lock()
+        self._reconnect_unavailable_logged = False
+        self._tasks = []
+        self._server = None
+
+    async def _collect_resmon(self, family: _Family):
+        response = await self.resource_monitor.general(self.timeout)
+        item = response["data"]["item"]
+        family.add("fnos_cpu_busy_percent", "CPU usage in percent", item.get("cpuBusy"))
+        family.add("fnos_memory_used_percent", "Memory usage in percent", item.get("memPercent"))
+        store_speed = item.get("storeSpeed", {})
+        family.add("fnos_storage_read_bytes_per_second", "Storage read speed", store_speed.get("read"))
+        family.add("fnos_storage_write_bytes_per_second", "Storage write speed", store_speed.get("write"))
+        net_speed = item.get("netSpeed", {})
+        family.add("fnos_network_receive_bytes_per_second", "Network receive speed", net_speed.get("receive"))
+        family.add("fnos_network_transmit_bytes_per_second", "Network transmit speed", net_speed.get("transmit"))
+
+    async def _collect_store(self, family: _Family):
+        general, space = await asyncio.gather(
+            self.store.general(self.timeout),
+            self.store.calculate_space(self.timeout),
+        )
+        for volume in general["array"]:
+            labels = {"name": volume.get("name"), "mountpoint": volume.get("mountpoint"), "level": volume.get("level")}
+            family.add("fnos_volume_size_bytes", "Volume size in bytes", volume.get("fssize"), labels)
+            family.add("fnos_volume_free_bytes", "Volume free space in bytes", volume.get("frsize"), labels)
+        family.add("fnos_system_size_bytes", "System partition size in bytes", space.get("fssizeSys"))
+        family.add("fnos_system_free_bytes", "System partition free space in bytes", space.get("frsizeSys"))
+        family.add("fnos_storage_size_bytes", "Total storage size in bytes", space.get("fssizeStor"))
+        family.add("fnos_storage_free_bytes", "Total storage free space in bytes", space.get("frsizeStor"))
+        for disk_type in ("HDD", "SSD", "USB"):
+            family.add("fnos_disks", "Number of disks by type", space.get(disk_type), {"type": disk_type})
+
+    async def _collect_docker(self, family: _Family):
+        response = await self.docker_manager.stats(self.timeout)
+        for container_id, stats in response["rsp"].items():
+            labels = {"id": container_id}
+            family.add("fnos_container_cpu_usage", "Container CPU usage", stats.get("cpuUsage"), labels)
+            family.add("fnos_container_memory_used_bytes", "Container memory usage in bytes", stats.get("usedMem"), labels)
+            family.add("fnos_container_network_receive_bytes", "Container network received bytes",
+                       stats.get("networkRx"), labels, "counter")
+            family.add("fnos_container_network_transmit_bytes", "Container network transmitted bytes",
+                       stats.get("networkTx"), labels, "counter")
+
+    async def _collect_ups(self, family: _Family):
+        response = await self.sac.ups_status(self.timeout)
+        data = response["data"]
+        family.add("fnos_ups_enabled", "Whether UPS support is enabled", data.get("upsEnabled"))
+        current = data.get("currentUps") or {}
+        if current:
+            labels = {"name": current.get("name"), "power_supply": current.get("powerSupplyType")}
+            family.add("fnos_ups_status", "UPS status", current.get("status"), labels)
+            family.add("fnos_ups_battery_charge_percent", "UPS battery charge", current.get("batteryCharge"), labels)
+            family.add("fnos_ups_runtime_seconds", "UPS estimated runtime", current.get("runtime"), labels)
+
+    async def _collect_notify(self, family: _Family):
+        response = await self.notify.unread_total(self.timeout)
+        family.add("fnos_notify_unread", "Number of unread notifications", response["unreadTotal"])
+
+    def _rebuild(self):
+        """重新拼接预渲染的/metrics内容"""
+        status = _Family()
+        for family in self.intervals:
+            labels = {"family": family}
+            status.add("fnos_exporter_up", "Whether the last refresh of the family succeeded", self._up[family], labels)
+            status.add("fnos_exporter_last_success_timestamp_seconds", "Time of the last successful refresh",
+                       self._last_success[family], labels)
+            status.add("fnos_exporter_refresh_duration_seconds", "Duration of the last refresh",
+                       self._durations[family], labels)
+        self._payload = b"".join(self._fragments.values()) + status.render()
+
+    async def refresh(self, family: str) -> bool:
+        """
+        立即刷新一个指标族
+
+        失败时保留上一次成功的结果，并将fnos_exporter_up置为0。
+
+        Args:
+            family: 指标族名称
+
+        Returns:
+            bool: 是否刷新成功
+        """
+        if family not in self.intervals:
+            raise ValueError(f"不支持的指标族: {family}")
+        rendered = _Family()
+        started = time.monotonic()
+        try:
+            await self._collectors[family](rendered)
+        except Exception as e:
+            logger.warning(f"刷新指标失败: {family}, {e}")
+            self._up[family] = 0
+            success = False
+        else:
+            self._fragments[family] = rendered.render()
+            self._up[family] = 1
+            self._last_success[family] = time.time()
+            success = True
+        self._durations[family] = time.monotonic() - started
+        self._rebuild()
+        return success
+
+    async def refresh_all(self):
+        """并发刷新所有指标族"""
+        await asyncio.gather(*(self.refresh(family) for family in self.intervals))
+
+    async def _ensure_connected(self) -> bool:
+        """确认会话可用；断开时只由一个调用方重连，重连进行中的其他调用方直接返回False"""
+        client = self.client
+        if client.connected:
+            return True
+        if self._reconnect_lock.locked():
+            return False
+        async with self._reconnect_lock:
+            # 等待锁期间可能已经重连成功
+            if client.connected:
+                return True
+            if not client.username or not client.password:
+                if not self._reconnect_unavailable_logged:
+                    logger.warning("会话已断开，且没有保存的用户名和密码（例如token登录），无法自动重连")
+                    self._reconnect_unavailable_logged = True
+                return False
+            try:
+                await client.reconnect()
+            except Exception as e:
+                logger.warning(f"重连失败: {e}")
+                return False
+        return client.connected
+
+    async def _refresh_loop(self, family: str):
+        interval = self.intervals[family]
+        while True:
+            await asyncio.sleep(interval)
+            if not await self._ensure_connected():
+                self._up[family] = 0
+                self._rebuild()
+                continue
+            await self.refresh(family)
+
+    def render(self) -> bytes:
+        """返回预渲染的/metrics内容"""
+        return self._payload
+
+    async def start(self):
+        """先完成一次全量刷新，再为每个指标族启动后台刷新任务"""
+        await self.refresh_all()
+        self._tasks = [asyncio.create_task(self._refresh_loop(family)) for family in self.intervals]
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """处理一个HTTP请求"""
+        try:
+            request_line = await reader.readline()
+            # 丢弃请求头
+            while True:
+                line = await reader.readline()
+                if not line or line in (b"\r\n", b"\n"):
+                    break
+            parts = request_line.decode("latin-1").split()
+            path = parts[1].split("?", 1)[0] if len(parts) >= 2 else ""
+            if path == "/metrics":
+                body = self._payload
+                status = "200 OK"
+                content_type = CONTENT_TYPE
+            else:
+                body = b"Not Found\n"
+                status = "404 Not Found"
+                content_type = "text/plain; charset=utf-8"
+            head = (
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode("latin-1")
+            writer.write(head)
+            writer.write(body)
+            await writer.drain()
+        except Exception as e:
+            logger.debug(f"处理/metrics请求出错: {e}")
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "0.0.0.0", port: int = 9100):
+        """
+        启动后台刷新并在host:port上提供/metrics
+
+        Args:
+            host: 监听地址，默认为"0.0.0.0"
+            port: 监听端口，默认为9100
+
+        Returns:
+            asyncio.Server: HTTP服务器对象
+        """
+        await self.start()
+        self._server = await asyncio.start_server(self._handle, host, port)
+        logger.info(f"Prometheus exporter 已在 {host}:{port} 上启动")
+        return self._server
+
+    async def stop(self):
+        """停止后台刷新和HTTP服务器"""
+        for task in self._tasks:
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
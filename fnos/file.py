@@ -15,12 +15,167 @@
 import json
 import asyncio
 import logging
+from array import array
 from .client import FnosClient
 
 # 创建logger实例
 logger = logging.getLogger(__name__)
 
 
+# 用于逐条解析file.ls响应中的files数组
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\r\n'
+
+
+def _skip_whitespace(text: str, idx: int) -> int:
+    length = len(text)
+    while idx < length and text[idx] in _WHITESPACE:
+        idx += 1
+    return idx
+
+
+def _find_top_level_array(text: str, key: str) -> int:
+    """
+    在顶层JSON对象中查找key对应的数组，返回其'['的位置，找不到时返回-1
+
+    只按顶层对象的键匹配，其他键的值会被完整跳过，不会误匹配值或嵌套对象中的同名字符串。
+    """
+    idx = _skip_whitespace(text, 0)
+    if idx >= len(text) or text[idx] != '{':
+        return -1
+    idx += 1
+    try:
+        while True:
+            idx = _skip_whitespace(text, idx)
+            if idx >= len(text) or text[idx] == '}':
+                return -1
+            name, idx = _decoder.raw_decode(text, idx)
+            idx = _skip_whitespace(text, idx)
+            if idx >= len(text) or text[idx] != ':':
+                return -1
+            idx = _skip_whitespace(text, idx + 1)
+            if name == key:
+                return idx if idx < len(text) and text[idx] == '[' else -1
+            _, idx = _decoder.raw_decode(text, idx)
+            idx = _skip_whitespace(text, idx)
+            if idx < len(text) and text[idx] == ',':
+                idx += 1
+    except ValueError:
+        return -1
+
+
+def _iter_json_array(text: str, start: int):
+    """从text[start]处的JSON数组中逐个解析元素"""
+    idx = start + 1
+    length = len(text)
+    while idx < length:
+        # 跳过空白和分隔符
+        while idx < length and text[idx] in ' \t\r\n,':
+            idx += 1
+        if idx >= length or text[idx] == ']':
+            return
+        item, idx = _decoder.raw_decode(text, idx)
+        yield item
+
+
+def _index_entries(files: list) -> dict:
+    """按文件名建立索引：name -> (条目, 用于比较变化的签名)"""
+    return {
+        entry["name"]: (entry, (entry.get("size"), entry.get("mtim"), entry.get("btim"), entry.get("dir")))
+        for entry in files
+    }
+
+
+def _join_path(parent: str, name: str) -> str:
+    """拼接远端路径"""
+    return f"{parent.rstrip('/')}/{name}"
+
+
+class DiskUsage:
+    """
+    File.du()的统计结果
+
+    所有目录按发现顺序编号（父目录的编号总是小于子目录），
+    各项统计保存在紧凑的array中，而不是每个目录一个dict。
+
+    Attributes:
+        paths: 目录路径列表，下标即目录编号
+        parents: 父目录编号，根目录为-1
+        sizes: 子树总字节数
+        files: 子树文件总数
+        dirs: 子树目录总数（不含自身）
+        errors: 列目录失败的路径及服务器返回结果（请求出错时为异常对象）
+    """
+
+    def __init__(self):
+        self.paths = []
+        self.parents = array('q')
+        self.sizes = array('q')
+        self.files = array('q')
+        self.dirs = array('q')
+        self.errors = []
+        self._index = {}
+
+    def _add(self, path: str, parent: int, size: int, files: int) -> int:
+        """添加一个目录（size、files为目录自身直接包含的文件），返回其编号"""
+        idx = len(self.paths)
+        self.paths.append(path)
+        self.parents.append(parent)
+        self.sizes.append(size)
+        self.files.append(files)
+        self.dirs.append(0)
+        self._index[path] = idx
+        return idx
+
+    def _aggregate(self):
+        """自底向上累加子树统计"""
+        parents, sizes, files, dirs = self.parents, self.sizes, self.files, self.dirs
+        for idx in range(len(parents) - 1, 0, -1):
+            parent = parents[idx]
+            if parent >= 0:
+                sizes[parent] += sizes[idx]
+                files[parent] += files[idx]
+                dirs[parent] += dirs[idx] + 1
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._index
+
+    @property
+    def total(self) -> int:
+        """根目录子树总字节数"""
+        return self.sizes[0] if self.sizes else 0
+
+    def get(self, path: str) -> dict:
+        """
+        获取指定目录的统计
+
+        Args:
+            path: 目录路径
+
+        Returns:
+            dict: {"path": 路径, "size": 总字节数, "files": 文件数, "dirs": 目录数}
+        """
+        idx = self._index[path]
+        return {
+            "path": path,
+            "size": self.sizes[idx],
+            "files": self.files[idx],
+            "dirs": self.dirs[idx],
+        }
+
+    def children(self, path: str) -> list:
+        """获取指定目录的直接子目录路径列表"""
+        idx = self._index[path]
+        return [self.paths[i] for i in range(idx + 1, len(self.paths)) if self.parents[i] == idx]
+
+    def items(self):
+        """按编号遍历(path, size)"""
+        return zip(self.paths, self.sizes)
+
+
 class File:
     def __init__(self, client: FnosClient):
         """
@@ -30,6 +185,8 @@ class File:
             client: FnosClient实例
         """
         self.client = client
+        # du缓存：目录路径 -> (uver, 自身文件字节数, 自身文件数, 子目录名元组)
+        self._du_cache = {}
     
     async def list(self, path: str = None, timeout: float = 10.0) -> dict:
         """
@@ -73,6 +230,35 @@ class File:
         response = await self.client.request_payload_with_response("file.ls", payload, timeout)
         return response
     
+    async def iter_list(self, path: str = None, timeout: float = 10.0):
+        """
+        以增量方式列出指定目录下的文件和文件夹
+        
+        与list()相同，但响应不会被整体解析为dict：files数组中的条目在迭代时逐个解析并产出，
+        适合包含大量条目的目录。条目数量极大时，建议为该连接单独调大connect()的max_size参数。
+        
+        Args:
+            path: 查询目录路径(为None默认为用户目录)，格式为vol{stor_id}/{user_id}/{path}
+            timeout: 请求超时时间（秒），默认为10.0秒
+            
+        Yields:
+            dict: files数组中的单个条目，格式同list()
+        """
+        # 构造请求参数
+        payload = {}
+        if path is not None:
+            payload["path"] = path
+        
+        message = await self.client.request_payload_with_response("file.ls", payload, timeout, raw=True)
+        
+        # 定位顶层files数组
+        start = _find_top_level_array(message, "files")
+        if start < 0:
+            raise Exception(f"列出目录失败: {message}")
+        
+        for entry in _iter_json_array(message, start):
+            yield entry
+    
     async def mkdir(self, path: str, timeout: float = 10.0) -> dict:
         """
         创建文件夹
@@ -195,4 +381,187 @@ class File:
         
         # 使用FnoClient的新方法发送请求并等待响应
         response = await self.client.request_payload_with_response("file.getAcl", payload, timeout)
-        return response
\ No newline at end of file
+        return response
+    
+    async def du(self, path: str, concurrency: int = 8, use_cache: bool = True,
+                 timeout: float = 10.0) -> DiskUsage:
+        """
+        统计目录及其所有子目录的占用空间（类似du命令）
+        
+        并发遍历目录树，自底向上汇总每个目录的子树大小。每个目录的汇总结果按
+        file.ls返回的uver缓存在实例上；再次统计时仍会列出每个目录，
+        但uver未变化的目录直接使用缓存的汇总结果，不再逐项累加。
+        uver只反映目录自身的变化，因此不会根据上级目录的uver跳过下级目录。
+        
+        Args:
+            path: 查询目录路径，格式为vol{stor_id}/{user_id}/{path}
+            concurrency: 同时进行的file.ls请求数上限，默认为8
+            use_cache: 是否使用uver缓存，默认为True
+            timeout: 单次file.ls请求超时时间（秒），默认为10.0秒
+            
+        Returns:
+            DiskUsage: 统计结果，例如 result.total、result.get(path)["size"]
+        """
+        # 验证参数
+        if not path:
+            raise ValueError("path参数不能为空")
+        if concurrency < 1:
+            raise ValueError("concurrency参数必须大于0")
+        
+        result = DiskUsage()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def walk(dir_path: str, parent: int):
+            async with semaphore:
+                try:
+                    response = await self.list(dir_path, timeout)
+                except Exception as e:
+                    logger.warning(f"列出目录失败: {dir_path}, {e}")
+                    result.errors.append((dir_path, e))
+                    return
+            
+            if "files" not in response:
+                logger.warning(f"列出目录失败: {dir_path}, {response}")
+                result.errors.append((dir_path, response))
+                return
+            
+            uver = response.get("uver")
+            cached = self._du_cache.get(dir_path)
+            if use_cache and uver is not None and cached is not None and cached[0] == uver:
+                _, size, count, subdirs = cached
+            else:
+                size = 0
+                count = 0
+                subdirs = []
+                for entry in response["files"]:
+                    if entry.get("dir"):
+                        subdirs.append(entry["name"])
+                    else:
+                        size += entry.get("size", 0)
+                        count += 1
+                if uver is not None:
+                    self._du_cache[dir_path] = (uver, size, count, tuple(subdirs))
+            # 释放响应，避免大目录的列表在遍历期间常驻内存
+            del response
+            
+            idx = result._add(dir_path, parent, size, count)
+            if subdirs:
+                await asyncio.gather(*(walk(_join_path(dir_path, name), idx) for name in subdirs))
+        
+        await walk(path, -1)
+        result._aggregate()
+        return result
+    
+    async def watch(self, paths, interval: float = 5.0, max_interval: float = None,
+                    timeout: float = 10.0):
+        """
+        监视目录变化，产出新建、删除和修改事件
+        
+        每个目录先用file.getAcl做一次轻量的版本检查，只有uver变化时才重新file.ls并与上次结果比对。
+        长时间没有变化的目录会逐步放慢检查频率（最长max_interval），一旦发生变化立即恢复为interval。
+        
+        Args:
+            paths: 目录路径或目录路径列表，格式为vol{stor_id}/{user_id}/{path}
+            interval: 最短检查间隔（秒），默认为5.0秒
+            max_interval: 最长检查间隔（秒），默认为interval的8倍
+            timeout: 单次请求超时时间（秒），默认为10.0秒
+            
+        Yields:
+            dict: 变化事件
+            示例:
+            {
+              "type": "created", // created、deleted或modified
+              "path": "vol1/1000/test", // 所在目录
+              "name": "a.txt", // 文件名称
+              "entry": {"name": "a.txt", "uid": 1000, "size": 1, "mtim": 1763038335, "btim": 1763038335}
+            }
+        """
+        if isinstance(paths, str):
+            paths = [paths]
+        # 验证参数
+        if not paths:
+            raise ValueError("paths参数不能为空")
+        if interval <= 0:
+            raise ValueError("interval参数必须大于0")
+        if max_interval is None:
+            max_interval = interval * 8
+        max_interval = max(max_interval, interval)
+        
+        loop = asyncio.get_running_loop()
+        
+        async def probe(path: str):
+            """返回目录当前的uver，失败时返回None"""
+            try:
+                response = await self.get_acl([path], timeout)
+            except Exception as e:
+                logger.warning(f"检查目录版本失败: {path}, {e}")
+                return None
+            return response.get("uver")
+        
+        async def snapshot(path: str):
+            """返回目录当前的文件索引，失败时返回None"""
+            try:
+                response = await self.list(path, timeout)
+            except Exception as e:
+                logger.warning(f"列出目录失败: {path}, {e}")
+                return None
+            if "files" not in response:
+                logger.warning(f"列出目录失败: {path}, {response}")
+                return None
+            return _index_entries(response["files"])
+        
+        # 建立初始状态：path -> [uver, 文件索引(失败时为None), 当前间隔, 下次检查时间]
+        states = {}
+        uvers = await asyncio.gather(*(probe(path) for path in paths))
+        indexes = await asyncio.gather(*(snapshot(path) for path in paths))
+        now = loop.time()
+        for path, uver, index in zip(paths, uvers, indexes):
+            states[path] = [uver, index, interval, now + interval]
+        
+        while True:
+            next_due = min(state[3] for state in states.values())
+            delay = next_due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            
+            now = loop.time()
+            due = [path for path, state in states.items() if state[3] <= now]
+            uvers = await asyncio.gather(*(probe(path) for path in due))
+            # 尚未成功列出过的目录（没有基准）无论uver是否变化都要重新列出
+            changed = [
+                path for path, uver in zip(due, uvers)
+                if uver is None or states[path][1] is None or uver != states[path][0]
+            ]
+            indexes = await asyncio.gather(*(snapshot(path) for path in changed))
+            new_indexes = dict(zip(changed, indexes))
+            
+            now = loop.time()
+            for path, uver in zip(due, uvers):
+                state = states[path]
+                index = new_indexes.get(path)
+                events = []
+                old_index = state[1]
+                if index is not None and old_index is not None:
+                    for name, (entry, signature) in index.items():
+                        old = old_index.get(name)
+                        if old is None:
+                            events.append({"type": "created", "path": path, "name": name, "entry": entry})
+                        elif old[1] != signature:
+                            events.append({"type": "modified", "path": path, "name": name, "entry": entry})
+                    for name, (entry, _) in old_index.items():
+                        if name not in index:
+                            events.append({"type": "deleted", "path": path, "name": name, "entry": entry})
+                if index is not None:
+                    # 首次成功列出时仅建立基准，不产出事件
+                    state[0] = uver
+                    state[1] = index
+                
+                # 有变化时恢复最短间隔，否则逐步放慢
+                if events:
+                    state[2] = interval
+                else:
+                    state[2] = min(state[2] * 1.5, max_interval)
+                state[3] = now + state[2]
+                
+                for event in events:
+                    yield event
\ No newline at end of file
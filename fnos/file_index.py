@@ -0,0 +1,230 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import sqlite3
+from .client import FnosClient
+from .file import File, _join_path
+
+# 创建logger实例
+logger = logging.getLogger(__name__)
+
+# 前缀查询的上界后缀，配合 >= / < 区间使用索引
+_PREFIX_END = "\U0010ffff"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    uver INTEGER
+);
+CREATE TABLE IF NOT EXISTS files (
+    dir TEXT NOT NULL,
+    name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER,
+    mtim INTEGER,
+    btim INTEGER,
+    uid INTEGER,
+    is_dir INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (dir, name)
+);
+CREATE INDEX IF NOT EXISTS idx_files_name ON files (name);
+CREATE INDEX IF NOT EXISTS idx_files_path ON files (path);
+CREATE INDEX IF NOT EXISTS idx_files_size ON files (size);
+CREATE INDEX IF NOT EXISTS idx_files_mtim ON files (mtim);
+CREATE INDEX IF NOT EXISTS idx_files_btim ON files (btim);
+"""
+
+_COLUMNS = "dir, name, path, size, mtim, btim, uid, is_dir"
+
+
+class FileIndex:
+    def __init__(self, client: FnosClient, db_path: str):
+        """
+        初始化FileIndex类
+
+        在本地SQLite数据库中保存NAS文件树的元数据（name、size、mtim、btim、uid、dir），
+        通过crawl()并发抓取并按uver增量刷新，查询完全在本地完成。
+
+        Args:
+            client: FnosClient实例
+            db_path: SQLite数据库文件路径，":memory:"表示内存数据库
+        """
+        self.client = client
+        self.file = File(client)
+        self.db = sqlite3.connect(db_path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(_SCHEMA)
+        self.db.commit()
+
+    def close(self):
+        """关闭数据库连接"""
+        self.db.close()
+
+    def _delete_subtree(self, path: str):
+        """删除目录及其所有子孙的记录"""
+        lower = path.rstrip('/') + '/'
+        upper = lower + _PREFIX_END
+        self.db.execute("DELETE FROM files WHERE path = ? OR (path >= ? AND path < ?)", (path, lower, upper))
+        self.db.execute("DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)", (path, lower, upper))
+
+    def _store_dir(self, path: str, uver, files: list) -> list:
+        """用一次事务写入目录的列表结果，返回子目录名列表"""
+        rows = []
+        subdirs = []
+        for entry in files:
+            name = entry["name"]
+            is_dir = 1 if entry.get("dir") else 0
+            if is_dir:
+                subdirs.append(name)
+            rows.append((
+                path, name, _join_path(path, name), entry.get("size"), entry.get("mtim"),
+                entry.get("btim"), entry.get("uid"), is_dir,
+            ))
+
+        with self.db:
+            # 删除已不存在的子目录的整棵子树
+            names = {row[1] for row in rows}
+            for (name,) in self.db.execute(
+                "SELECT name FROM files WHERE dir = ? AND is_dir = 1", (path,)
+            ).fetchall():
+                if name not in names:
+                    self._delete_subtree(_join_path(path, name))
+            self.db.execute("DELETE FROM files WHERE dir = ?", (path,))
+            self.db.executemany(f"INSERT INTO files ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self.db.execute("INSERT OR REPLACE INTO dirs (path, uver) VALUES (?, ?)", (path, uver))
+        return subdirs
+
+    async def crawl(self, path: str, concurrency: int = 8, timeout: float = 10.0) -> dict:
+        """
+        并发抓取目录树并写入索引
+
+        每个目录都会重新列出。已索引的目录若file.ls返回的uver未变化，则不再写入该目录的记录，
+        但仍会继续深入其子目录（uver只反映目录自身的变化）；
+        否则重写该目录的记录，并删除已消失子目录的整棵子树。
+
+        Args:
+            path: 根目录路径，格式为vol{stor_id}/{user_id}/{path}
+            concurrency: 同时进行的file.ls请求数上限，默认为8
+            timeout: 单次file.ls请求超时时间（秒），默认为10.0秒
+
+        Returns:
+            dict: 本次抓取的统计
+            示例:
+            {
+              "listed": 120, // 发出的file.ls请求数
+              "updated": 3, // 重新写入的目录数
+              "unchanged": 117, // uver未变化而未重新写入的目录数
+              "errors": 0 // 列目录失败的目录数
+            }
+        """
+        # 验证参数
+        if not path:
+            raise ValueError("path参数不能为空")
+        if concurrency < 1:
+            raise ValueError("concurrency参数必须大于0")
+
+        stats = {"listed": 0, "updated": 0, "unchanged": 0, "errors": 0}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def walk(dir_path: str):
+            async with semaphore:
+                try:
+                    response = await self.file.list(dir_path, timeout)
+                except Exception as e:
+                    logger.warning(f"列出目录失败: {dir_path}, {e}")
+                    stats["errors"] += 1
+                    return
+            stats["listed"] += 1
+
+            if "files" not in response:
+                logger.warning(f"列出目录失败: {dir_path}, {response}")
+                stats["errors"] += 1
+                return
+
+            uver = response.get("uver")
+            row = self.db.execute("SELECT uver FROM dirs WHERE path = ?", (dir_path,)).fetchone()
+            if uver is not None and row is not None and row["uver"] == uver:
+                stats["unchanged"] += 1
+                subdirs = [entry["name"] for entry in response["files"] if entry.get("dir")]
+            else:
+                subdirs = self._store_dir(dir_path, uver, response["files"])
+                stats["updated"] += 1
+            # 释放响应，避免大目录的列表在遍历期间常驻内存
+            del response
+            if subdirs:
+                await asyncio.gather(*(walk(_join_path(dir_path, name)) for name in subdirs))
+
+        await walk(path)
+        return stats
+
+    def search(self, name_prefix: str = None, glob: str = None, under: str = None,
+               min_size: int = None, max_size: int = None,
+               mtim_from: int = None, mtim_to: int = None,
+               btim_from: int = None, btim_to: int = None,
+               is_dir: bool = None, limit: int = 1000) -> list:
+        """
+        在本地索引中查询文件，所有条件之间为“且”关系
+
+        Args:
+            name_prefix: 文件名前缀
+            glob: 文件名通配符（区分大小写，例如"*.jpg"）
+            under: 只查询该目录下（含所有子孙目录）的条目
+            min_size: 最小文件大小（含）
+            max_size: 最大文件大小（含）
+            mtim_from: mtim下限（含）
+            mtim_to: mtim上限（含）
+            btim_from: btim下限（含）
+            btim_to: btim上限（含）
+            is_dir: True只查文件夹，False只查文件，None不限
+            limit: 最多返回的条目数，默认为1000
+
+        Returns:
+            list: 条目列表，每个条目为包含dir、name、path、size、mtim、btim、uid、is_dir的dict
+        """
+        clauses = []
+        params = []
+        if name_prefix:
+            clauses.append("name >= ? AND name < ?")
+            params += [name_prefix, name_prefix + _PREFIX_END]
+        if glob:
+            clauses.append("name GLOB ?")
+            params.append(glob)
+        if under:
+            lower = under.rstrip('/') + '/'
+            clauses.append("path >= ? AND path < ?")
+            params += [lower, lower + _PREFIX_END]
+        for column, op, value in (
+            ("size", ">=", min_size), ("size", "<=", max_size),
+            ("mtim", ">=", mtim_from), ("mtim", "<=", mtim_to),
+            ("btim", ">=", btim_from), ("btim", "<=", btim_to),
+        ):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                params.append(value)
+        if is_dir is not None:
+            clauses.append("is_dir = ?")
+            params.append(1 if is_dir else 0)
+
+        sql = f"SELECT {_COLUMNS} FROM files"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " LIMIT ?"
+        params.append(limit)
+        return [dict(row) for row in self.db.execute(sql, params)]
+
+    def count(self) -> int:
+        """返回索引中的条目总数"""
+        return self.db.execute("SELECT COUNT(*) FROM files").fetchone()[0]
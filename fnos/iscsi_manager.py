@@ -20,6 +20,109 @@ from .client import FnosClient
 logger = logging.getLogger(__name__)
 
 
+def _rows(response: dict, key: str) -> list:
+    """取出响应data中的列表字段，不存在时返回空列表"""
+    data = response.get("data") if isinstance(response, dict) else None
+    if not isinstance(data, dict):
+        return []
+    return data.get(key) or []
+
+
+def _refs(item: dict, key: str, fields: tuple) -> list:
+    """
+    取出条目中引用其他对象的标识列表
+
+    引用可以是字符串，也可以是包含fields中任一字段的dict。
+    """
+    refs = []
+    for ref in item.get(key) or []:
+        if isinstance(ref, dict):
+            refs.extend(ref[field] for field in fields if ref.get(field))
+        elif ref:
+            refs.append(ref)
+    return refs
+
+
+class IscsiTopology:
+    """
+    IscsiManager.topology()的结果：Target、LUN、Initiator与LUN用户组的索引模型
+
+    Target与LUN、Initiator之间的关联取自Target条目中的luns、initiators字段（元素为名称、WWN、IQN字符串，
+    或包含lunName/wwn、iqn/name字段的dict），服务器未返回这些字段时关联为空。
+
+    Attributes:
+        config: get_config()返回结果中的data
+        targets: IQN -> Target信息
+        targets_by_name: Target名称 -> Target信息
+        luns: LUN名称 -> LUN信息
+        luns_by_wwn: WWN -> LUN信息
+        initiators: IQN（或名称） -> Initiator信息
+        usergroups: LUN名称 -> list_lun_usergroups()返回结果中的data，查询失败时为抛出的异常对象
+    """
+
+    def __init__(self, config: dict, targets: dict, luns: dict, initiators: dict, usergroups: dict):
+        self.config = config.get("data") or {}
+        self.targets = {}
+        self.targets_by_name = {}
+        self.luns = {}
+        self.luns_by_wwn = {}
+        self.initiators = {}
+        self.usergroups = usergroups
+        self._luns_of_target = {}
+        self._targets_of_lun = {}
+        self._targets_of_initiator = {}
+
+        for lun in _rows(luns, "luns"):
+            self.luns[lun["lunName"]] = lun
+            if lun.get("wwn"):
+                self.luns_by_wwn[lun["wwn"]] = lun
+        for initiator in _rows(initiators, "initiators"):
+            key = initiator.get("iqn") or initiator.get("name")
+            if key:
+                self.initiators[key] = initiator
+        for target in _rows(targets, "targets"):
+            iqn = target["iqn"]
+            self.targets[iqn] = target
+            if target.get("targetName"):
+                self.targets_by_name[target["targetName"]] = target
+            members = []
+            for ref in _refs(target, "luns", ("lunName", "wwn")):
+                lun = self.lun(ref)
+                if lun is not None and lun not in members:
+                    members.append(lun)
+                    self._targets_of_lun.setdefault(lun["lunName"], []).append(target)
+            self._luns_of_target[iqn] = members
+            for ref in _refs(target, "initiators", ("iqn", "name")):
+                self._targets_of_initiator.setdefault(ref, []).append(target)
+
+    def target(self, key: str) -> dict:
+        """按IQN或名称获取Target，不存在时返回None"""
+        return self.targets.get(key) or self.targets_by_name.get(key)
+
+    def lun(self, key: str) -> dict:
+        """按名称或WWN获取LUN，不存在时返回None"""
+        return self.luns.get(key) or self.luns_by_wwn.get(key)
+
+    def luns_of_target(self, key: str) -> list:
+        """获取Target（IQN或名称）下的LUN列表"""
+        target = self.target(key)
+        return self._luns_of_target.get(target["iqn"], []) if target is not None else []
+
+    def targets_of_lun(self, key: str) -> list:
+        """获取包含LUN（名称或WWN）的Target列表"""
+        lun = self.lun(key)
+        return self._targets_of_lun.get(lun["lunName"], []) if lun is not None else []
+
+    def targets_of_initiator(self, iqn: str) -> list:
+        """获取允许该Initiator访问的Target列表"""
+        return self._targets_of_initiator.get(iqn, [])
+
+    def usergroups_of_lun(self, key: str):
+        """获取LUN（名称或WWN）的用户组信息，不存在时返回None"""
+        lun = self.lun(key)
+        return self.usergroups.get(lun["lunName"]) if lun is not None else None
+
+
 class IscsiManager:
     def __init__(self, client: FnosClient):
         """
@@ -109,3 +212,54 @@ class IscsiManager:
             "appcgi.iscsimgr.iscsi.target.list", {}, timeout
         )
         return response
+
+    async def topology(self, concurrency: int = 4, timeout: float = 10.0) -> IscsiTopology:
+        """
+        一次获取完整的 iSCSI 拓扑
+
+        并发请求配置、Target、LUN和Initiator列表，再以有限并发为每个LUN查询用户组，
+        返回可按Target、LUN名称、WWN和Initiator查找的IscsiTopology。
+
+        Args:
+            concurrency: 同时进行的LUN用户组请求数上限，默认为4
+            timeout: 单个请求超时时间（秒），默认为10.0秒
+
+        Returns:
+            IscsiTopology: iSCSI 拓扑
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency参数必须大于0")
+
+        config, targets, luns, initiators = await asyncio.gather(
+            self.get_config(timeout),
+            self.list_targets(timeout),
+            self.list_luns(timeout),
+            self.list_initiators(timeout),
+        )
+        if luns.get("result") != "succ":
+            raise Exception(f"获取 LUN 列表失败: {luns}")
+        if targets.get("result") != "succ":
+            raise Exception(f"获取 Target 列表失败: {targets}")
+        for name, response in (("配置", config), ("Initiator 列表", initiators)):
+            if response.get("result") != "succ":
+                logger.warning(f"获取 iSCSI {name}失败: {response}")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(lun: dict):
+            async with semaphore:
+                return await self.list_lun_usergroups(lun["lunName"], lun.get("wwn", ""), timeout)
+
+        lun_rows = _rows(luns, "luns")
+        responses = await asyncio.gather(*(fetch(lun) for lun in lun_rows), return_exceptions=True)
+        usergroups = {}
+        for lun, response in zip(lun_rows, responses):
+            if isinstance(response, asyncio.CancelledError):
+                raise response
+            if isinstance(response, Exception):
+                logger.warning(f"获取 LUN 用户组失败: {lun['lunName']}, {response}")
+                usergroups[lun["lunName"]] = response
+            else:
+                usergroups[lun["lunName"]] = response.get("data")
+
+        return IscsiTopology(config, targets, luns, initiators, usergroups)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import json
+import time
 import asyncio
 import logging
 from .client import FnosClient
@@ -30,6 +31,8 @@ class Network:
             client: FnosClient实例
         """
         self.client = client
+        # 网络拓扑缓存：(过期时间, probe_all()的结果)
+        self._probe_cache = None
     
     async def list(self, type: int = 0, timeout: float = 10.0) -> dict:
         """
@@ -69,4 +72,65 @@ class Network:
         
         # 使用FnoClient的新方法发送请求并等待响应
         response = await self.client.request_payload_with_response("appcgi.network.net.detect", payload, timeout)
-        return response
\ No newline at end of file
+        return response
+    
+    async def probe_all(self, concurrency: int = 4, detect_timeout: float = 5.0, ttl: float = 60.0,
+                        refresh: bool = False, timeout: float = 10.0) -> dict:
+        """
+        并发获取所有网络接口的信息并逐个检测
+        
+        同时请求type为0和1的网络列表，再以有限并发对所有接口执行检测。
+        结果按接口名称索引，在实例上缓存ttl秒。
+        
+        Args:
+            concurrency: 同时进行的检测请求数上限，默认为4
+            detect_timeout: 单个接口的检测超时时间（秒），默认为5.0秒
+            ttl: 缓存有效期（秒），默认为60.0秒，0表示不缓存
+            refresh: 是否忽略缓存强制重新获取，默认为False
+            timeout: 网络列表的请求超时时间（秒），默认为10.0秒
+            
+        Returns:
+            dict: 接口名称 -> 接口信息
+            示例:
+            {
+              "eth0": {
+                "type0": {...}, // list(type=0)中该接口的条目，不存在时为None
+                "type1": {...}, // list(type=1)中该接口的条目，不存在时为None
+                "detect": {...} // detect()的返回结果，检测失败时为抛出的异常对象
+              }
+            }
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency参数必须大于0")
+        
+        if not refresh and self._probe_cache is not None and self._probe_cache[0] > time.monotonic():
+            return self._probe_cache[1]
+        
+        lists = await asyncio.gather(self.list(0, timeout), self.list(1, timeout))
+        topology = {}
+        for list_type, response in enumerate(lists):
+            ifs = (response.get("data") or {}).get("net", {}).get("ifs")
+            if ifs is None:
+                raise Exception(f"获取网络列表失败: type={list_type}, {response}")
+            for item in ifs:
+                entry = topology.setdefault(item["name"], {"type0": None, "type1": None, "detect": None})
+                entry[f"type{list_type}"] = item
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def probe(if_name: str):
+            async with semaphore:
+                return await self.detect(if_name, detect_timeout)
+        
+        names = list(topology)
+        responses = await asyncio.gather(*(probe(name) for name in names), return_exceptions=True)
+        for name, response in zip(names, responses):
+            if isinstance(response, asyncio.CancelledError):
+                raise response
+            if isinstance(response, Exception):
+                logger.warning(f"检测网络接口失败: {name}, {response}")
+            topology[name]["detect"] = response
+        
+        if ttl > 0:
+            self._probe_cache = (time.monotonic() + ttl, topology)
+        return topology
@@ -12,12 +12,109 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
+import weakref
 from .client import FnosClient
 
 # 创建logger实例
 logger = logging.getLogger(__name__)
 
+# FnosClient -> _UnreadHub，同一连接上的所有watch_unread()共享一个订阅
+_hubs = weakref.WeakKeyDictionary()
+
+
+def _is_notify_push(data) -> bool:
+    """判断推送消息是否与通知有关"""
+    if not isinstance(data, dict):
+        return False
+    return "unreadTotal" in data or str(data.get("req", "")).startswith("notify.")
+
+
+class _UnreadHub:
+    """
+    一个连接上的未读通知数订阅
+
+    优先使用服务器推送：推送中带有unreadTotal时直接采用，否则立即重新请求一次；
+    超过轮询间隔没有收到推送时才主动请求notify.unreadTotal。只有数值变化时才分发给订阅者。
+    """
+
+    def __init__(self, notify: "Notify", timeout: float):
+        self.notify = notify
+        self.timeout = timeout
+        self.value = None
+        self.subscribers = {}
+        self.value_stale = True
+        self._wake = asyncio.Event()
+        self._task = None
+
+    @property
+    def poll_interval(self) -> float:
+        return min(self.subscribers.values())
+
+    def subscribe(self, poll_interval: float) -> asyncio.Queue:
+        queue = asyncio.Queue()
+        self.subscribers[queue] = poll_interval
+        if self.value is not None:
+            queue.put_nowait(self.value)
+        if self._task is None:
+            self.notify.client.add_push_listener(self._on_push)
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    async def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.pop(queue, None)
+        if self.subscribers or self._task is None:
+            return
+        self.notify.client.remove_push_listener(self._on_push)
+        _hubs.pop(self.notify.client, None)
+        task, self._task = self._task, None
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    def _publish(self, value):
+        if value is None or value == self.value:
+            return
+        self.value = value
+        for queue in self.subscribers:
+            queue.put_nowait(value)
+
+    def _on_push(self, data) -> bool:
+        if not _is_notify_push(data):
+            return False
+        if "unreadTotal" in data:
+            self._publish(data["unreadTotal"])
+        else:
+            # 推送中没有数值，唤醒后台任务重新请求
+            self.value_stale = True
+        # 收到推送后重新开始计算轮询间隔
+        self._wake.set()
+        return True
+
+    async def _fetch(self):
+        try:
+            response = await self.notify.unread_total(self.timeout)
+        except Exception as e:
+            logger.warning(f"获取未读通知总数失败: {e}")
+            return
+        if "unreadTotal" not in response:
+            logger.warning(f"获取未读通知总数失败: {response}")
+            return
+        self._publish(response["unreadTotal"])
+
+    async def _run(self):
+        while True:
+            self._wake.clear()
+            if self.value_stale:
+                self.value_stale = False
+                await self._fetch()
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                # 一个轮询间隔内没有收到推送，主动请求一次
+                self.value_stale = True
+
 
 class Notify:
     def __init__(self, client: FnosClient):
@@ -46,4 +143,33 @@ class Notify:
             }
         """
         response = await self.client.request_payload_with_response("notify.unreadTotal", {}, timeout)
-        return response
\ No newline at end of file
+        return response
+    
+    async def watch_unread(self, poll_interval: float = 60.0, timeout: float = 10.0):
+        """
+        监视未读通知总数，只在数值变化时产出
+        
+        同一FnosClient上的所有watch_unread()共享一个订阅：由服务器推送的通知消息驱动，
+        超过poll_interval没有收到推送时才请求一次notify.unreadTotal。
+        开始监视时先产出当前的未读总数。
+        
+        Args:
+            poll_interval: 没有推送时的轮询间隔（秒），默认为60.0秒；多个监视者时取最小值
+            timeout: 请求超时时间（秒），默认为10.0秒
+            
+        Yields:
+            int: 未读通知总数
+        """
+        # 验证参数
+        if poll_interval <= 0:
+            raise ValueError("poll_interval参数必须大于0")
+        
+        hub = _hubs.get(self.client)
+        if hub is None:
+            hub = _hubs[self.client] = _UnreadHub(self, timeout)
+        queue = hub.subscribe(poll_interval)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            await hub.unsubscribe(queue)
@@ -13,13 +13,19 @@
 # limitations under the License.
 
 import json
+import time
 import asyncio
 import logging
 from .client import FnosClient
+from .sac import SAC
+from .timeseries import CounterRate
 
 # 创建logger实例
 logger = logging.getLogger(__name__)
 
+# snapshot()支持的组件
+SNAPSHOT_COMPONENTS = ("cpu", "gpu", "memory", "disk", "net", "ups")
+
 
 class ResourceMonitor:
     def __init__(self, client: FnosClient):
@@ -118,4 +124,175 @@ class ResourceMonitor:
         payload = {"item": items}
         # 使用FnoClient的新方法发送请求并等待响应
         response = await self.client.request_payload_with_response("appcgi.resmon.gen", payload, timeout)
-        return response
\ No newline at end of file
+        return response
+    
+    async def _fixed_rate(self, fetch, interval: float):
+        """
+        按固定频率调用fetch()并产出采样结果，格式见sampler()
+        
+        Args:
+            fetch: 无参数的协程函数，返回本次采样的数据
+            interval: 采样间隔（秒）
+        """
+        if interval <= 0:
+            raise ValueError("interval参数必须大于0")
+        
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        tick = 0
+        skipped = 0
+        while True:
+            sent = time.time()
+            started = loop.time()
+            data = None
+            error = None
+            try:
+                data = await fetch()
+            except Exception as e:
+                logger.warning(f"资源监控采样失败: {e}")
+                error = e
+            latency = loop.time() - started
+            
+            yield {
+                "tick": tick,
+                "skipped": skipped,
+                "sent": sent,
+                "received": time.time(),
+                "latency": latency,
+                "data": data,
+                "error": error,
+            }
+            
+            # 下一个尚未到达的采样时刻
+            next_tick = max(tick + 1, int((loop.time() - start) / interval) + 1)
+            skipped = next_tick - tick - 1
+            tick = next_tick
+            delay = start + tick * interval - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+    
+    async def sampler(self, interval: float, items: list = None, timeout: float = 10.0):
+        """
+        按固定频率采样通用资源监控信息
+        
+        采样时刻按 起始时间 + n * interval 计算，不会因请求耗时而累积漂移；
+        若上一次采样耗时超过一个周期，则跳过已错过的时刻，而不会让请求重叠堆积。
+        
+        用法:
+            async for sample in resource_monitor.sampler(5.0):
+                print(sample["data"])
+        
+        Args:
+            interval: 采样间隔（秒）
+            items: 要查询的资源监控项列表，默认同general()
+            timeout: 单次请求超时时间（秒），默认为10.0秒
+            
+        Yields:
+            dict: 采样结果
+            示例:
+            {
+              "tick": 12, // 采样时刻序号
+              "skipped": 0, // 本次采样前跳过的时刻数
+              "sent": 1770444495.001, // 发送请求时的时间戳
+              "received": 1770444495.031, // 收到响应时的时间戳
+              "latency": 0.030, // 请求耗时（秒）
+              "data": {...}, // general()的返回结果，失败时为None
+              "error": None // 失败时为抛出的异常
+            }
+        """
+        async for sample in self._fixed_rate(lambda: self.general(timeout, items), interval):
+            yield sample
+    
+    async def rates(self, kind: str, interval: float, timeout: float = 10.0):
+        """
+        按固定频率采样网络或磁盘计数器并换算为每秒速率
+        
+        用法:
+            async for engine in resource_monitor.rates("net", 5.0):
+                for name, (receive, transmit) in engine.items():
+                    print(name, receive, transmit)
+        
+        Args:
+            kind: "net"（按接口计算receive、transmit）或"disk"（按磁盘计算read、write）
+            interval: 采样间隔（秒）
+            timeout: 单次请求超时时间（秒），默认为10.0秒
+            
+        Yields:
+            CounterRate: 每次成功采样后更新的同一个速率引擎实例
+        """
+        if kind == "net":
+            engine = CounterRate.for_net()
+            fetch = lambda: self.net(timeout)
+        elif kind == "disk":
+            engine = CounterRate.for_disk()
+            fetch = lambda: self.disk(timeout)
+        else:
+            raise ValueError("kind参数必须为net或disk")
+        
+        async for sample in self._fixed_rate(fetch, interval):
+            if sample["error"] is None and engine.update(sample["data"], sample["received"]):
+                yield engine
+    
+    async def snapshot(self, components: tuple = SNAPSHOT_COMPONENTS, deadline: float = 5.0) -> dict:
+        """
+        并发获取多个资源监控组件，组成一份完整快照
+        
+        所有组件同时请求，到达deadline时仍未返回的组件被放弃；单个组件失败不影响其他组件。
+        
+        Args:
+            components: 组件名称元组，可选值为"cpu"、"gpu"、"memory"、"disk"、"net"、"ups"（SAC.ups_status），默认为全部
+            deadline: 整个快照的截止时间（秒），默认为5.0秒
+            
+        Returns:
+            dict: 快照结果
+            示例:
+            {
+              "data": {"cpu": {...}, "memory": {...}}, // 成功返回的组件及服务器返回结果
+              "latency": {"cpu": 0.031, "memory": 0.028}, // 各组件请求耗时（秒）
+              "errors": {"gpu": Exception(...)}, // 请求失败的组件及异常
+              "missing": ["ups"], // 截止时间前未返回的组件
+              "elapsed": 0.035 // 快照总耗时（秒）
+            }
+        """
+        fetchers = {
+            "cpu": self.cpu,
+            "gpu": self.gpu,
+            "memory": self.memory,
+            "disk": self.disk,
+            "net": self.net,
+            "ups": SAC(self.client).ups_status,
+        }
+        for name in components:
+            if name not in fetchers:
+                raise ValueError(f"不支持的组件: {name}")
+        if deadline <= 0:
+            raise ValueError("deadline参数必须大于0")
+        
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = {"data": {}, "latency": {}, "errors": {}, "missing": [], "elapsed": 0.0}
+        
+        async def fetch(name: str):
+            begin = loop.time()
+            try:
+                result["data"][name] = await fetchers[name](deadline)
+            except Exception as e:
+                logger.warning(f"获取资源监控组件失败: {name}, {e}")
+                result["errors"][name] = e
+            finally:
+                result["latency"][name] = loop.time() - begin
+        
+        tasks = {name: asyncio.ensure_future(fetch(name)) for name in dict.fromkeys(components)}
+        if tasks:
+            _, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        for name, task in tasks.items():
+            if name not in result["data"] and name not in result["errors"]:
+                result["missing"].append(name)
+                result["latency"].pop(name, None)
+        
+        result["elapsed"] = loop.time() - started
+        return result
\ No newline at end of file
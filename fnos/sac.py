@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import json
+import time
 import asyncio
 import logging
 from .client import FnosClient
@@ -20,6 +21,43 @@ from .client import FnosClient
 # 创建logger实例
 logger = logging.getLogger(__name__)
 
+# watch_ups()比较的状态字段
+UPS_STATE_FIELDS = ("reachable", "enabled", "online", "on_battery", "charge_band")
+
+
+def _to_number(value):
+    """将数值字符串转换为float，无法转换时返回None"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _on_battery(current_ups: dict) -> bool:
+    """根据powerSupplyType判断UPS是否正在使用电池供电（兼容"battery"及NUT风格的"OB"）"""
+    supply = str(current_ups.get("powerSupplyType") or "").strip().lower()
+    return "batt" in supply or supply.split(" ")[0] == "ob"
+
+
+def _ups_state(response, thresholds: tuple) -> dict:
+    """从ups_status()的返回结果中提取用于比较的状态"""
+    if isinstance(response, Exception) or not isinstance(response, dict) or "data" not in response:
+        return {"reachable": False, "enabled": None, "online": None, "on_battery": None,
+                "charge_band": None, "battery_charge": None, "runtime": None}
+    data = response["data"] or {}
+    current = data.get("currentUps") or {}
+    charge = _to_number(current.get("batteryCharge"))
+    return {
+        "reachable": True,
+        "enabled": bool(data.get("upsEnabled")),
+        "online": bool(current.get("status")) if current else False,
+        "on_battery": _on_battery(current) if current else False,
+        # 电量低于（含）几个阈值
+        "charge_band": sum(1 for threshold in thresholds if charge <= threshold) if charge is not None else None,
+        "battery_charge": charge,
+        "runtime": _to_number(current.get("runtime")),
+    }
+
 
 class SAC:
     def __init__(self, client: FnosClient):
@@ -43,4 +81,104 @@ class SAC:
         """
         # 使用FnoClient的新方法发送请求并等待响应
         response = await self.client.request_payload_with_response("appcgi.sac.ups.v1.status", {}, timeout)
-        return response
\ No newline at end of file
+        return response
+    
+    async def watch_ups(self, interval: float = 30.0, battery_interval: float = 2.0,
+                        thresholds: tuple = (50, 20), timeout: float = 10.0):
+        """
+        监视UPS状态，只在状态变化时产出事件
+        
+        比较的状态包括：能否获取状态、是否启用UPS、UPS是否在线、是否使用电池供电，
+        以及电量跨越了哪些阈值。使用电池供电时按battery_interval快速轮询，否则按interval轮询。
+        开始监视时先产出一次当前状态（previous为None）。
+        
+        Args:
+            interval: 市电供电时的轮询间隔（秒），默认为30.0秒
+            battery_interval: 电池供电时的轮询间隔（秒），默认为2.0秒
+            thresholds: 电量阈值（百分比），电量降到阈值以下或回到阈值以上时产出事件，默认为(50, 20)
+            timeout: 请求超时时间（秒），默认为10.0秒
+            
+        Yields:
+            dict: 状态变化事件
+            示例:
+            {
+              "host": "fnos-host", // 主机名，未知时为连接地址
+              "changed": ["on_battery"], // 变化的状态字段
+              "state": {"reachable": true, "enabled": true, "online": true, "on_battery": true,
+                        "charge_band": 0, "battery_charge": 98.0, "runtime": 1800.0},
+              "previous": {...}, // 上一次的状态，第一次为None
+              "timestamp": 1770444495.0
+            }
+        """
+        # 验证参数
+        if interval <= 0 or battery_interval <= 0:
+            raise ValueError("interval和battery_interval参数必须大于0")
+        thresholds = tuple(thresholds)
+        
+        loop = asyncio.get_running_loop()
+        previous = None
+        while True:
+            started = loop.time()
+            try:
+                response = await self.ups_status(timeout)
+            except Exception as e:
+                logger.warning(f"获取UPS状态失败: {e}")
+                response = e
+            state = _ups_state(response, thresholds)
+            
+            changed = [field for field in UPS_STATE_FIELDS if previous is None or state[field] != previous[field]]
+            if changed:
+                yield {
+                    "host": self.client.host_name or self.client.endpoint,
+                    "changed": changed,
+                    "state": state,
+                    "previous": previous,
+                    "timestamp": time.time(),
+                }
+            previous = state
+            
+            delay = battery_interval if state["on_battery"] else interval
+            await asyncio.sleep(max(0.0, started + delay - loop.time()))
+    
+    @staticmethod
+    async def watch_ups_many(sacs: list, **kwargs):
+        """
+        在一个事件循环中同时监视多台主机的UPS状态
+        
+        每台主机一个轻量的轮询任务，事件合并为一个流产出。
+        
+        Args:
+            sacs: SAC实例列表
+            **kwargs: 传给watch_ups()的参数
+            
+        Yields:
+            dict: 状态变化事件，格式同watch_ups()
+        """
+        queue = asyncio.Queue()
+        
+        async def forward(sac: "SAC"):
+            async for event in sac.watch_ups(**kwargs):
+                await queue.put(event)
+        
+        tasks = [asyncio.create_task(forward(sac)) for sac in sacs]
+        getter = None
+        try:
+            while True:
+                getter = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait(tasks + [getter], return_when=asyncio.FIRST_COMPLETED)
+                if getter in done:
+                    yield getter.result()
+                    continue
+                getter.cancel()
+                # 某台主机的监视任务异常结束时向调用方抛出
+                for task in done:
+                    tasks.remove(task)
+                    task.result()
+                if not tasks:
+                    return
+        finally:
+            if getter is not None:
+                getter.cancel()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -13,14 +13,78 @@
 # limitations under the License.
 
 import json
+import time
 import asyncio
 import logging
 from .client import FnosClient
+from .exceptions import PermissionDenied
 
 # 创建logger实例
 logger = logging.getLogger(__name__)
 
 
+class StorageTopology:
+    """
+    Store.topology()的结果：存储空间、RAID阵列与磁盘的索引模型
+
+    Attributes:
+        space: stor.calcSpace的返回结果
+        volumes: 存储空间名称 -> 存储空间信息（stor.general的array条目，合并stor.state的状态）
+        volumes_by_uuid: 存储空间UUID -> 存储空间信息
+        pools: RAID阵列名称 -> 阵列信息（存储空间的md条目）
+        pools_by_uuid: RAID阵列UUID -> 阵列信息
+        disks: 磁盘名称 -> 磁盘信息（stor.listDisk的disk条目）
+    """
+
+    def __init__(self, general: dict, space: dict, disks: dict, state: dict):
+        self.space = space
+        self.volumes = {}
+        self.volumes_by_uuid = {}
+        self.pools = {}
+        self.pools_by_uuid = {}
+        self.disks = {disk["name"]: disk for disk in disks.get("disk", [])}
+        self._volume_of_pool = {}
+        self._pools_of_disk = {}
+
+        states = {item["uuid"]: item for item in state.get("state", [])}
+        for array_item in general.get("array", []):
+            volume = dict(array_item)
+            volume.update(states.get(volume["uuid"], {}))
+            self.volumes[volume["name"]] = volume
+            self.volumes_by_uuid[volume["uuid"]] = volume
+            for pool in volume.get("md", []):
+                self.pools[pool["name"]] = pool
+                self.pools_by_uuid[pool["uuid"]] = pool
+                self._volume_of_pool[pool["name"]] = volume
+                for member in pool.get("disk", []):
+                    self._pools_of_disk.setdefault(member["name"], []).append(pool)
+
+    def volume(self, key: str) -> dict:
+        """按名称或UUID获取存储空间，不存在时返回None"""
+        return self.volumes.get(key) or self.volumes_by_uuid.get(key)
+
+    def pool(self, key: str) -> dict:
+        """按名称或UUID获取RAID阵列，不存在时返回None"""
+        return self.pools.get(key) or self.pools_by_uuid.get(key)
+
+    def volume_of_pool(self, pool_name: str) -> dict:
+        """获取RAID阵列所属的存储空间"""
+        return self._volume_of_pool.get(pool_name)
+
+    def pools_of_disk(self, disk_name: str) -> list:
+        """获取磁盘所在的RAID阵列列表"""
+        return self._pools_of_disk.get(disk_name, [])
+
+    def volumes_of_disk(self, disk_name: str) -> list:
+        """获取使用该磁盘的存储空间列表"""
+        volumes = []
+        for pool in self.pools_of_disk(disk_name):
+            volume = self._volume_of_pool[pool["name"]]
+            if volume not in volumes:
+                volumes.append(volume)
+        return volumes
+
+
 class Store:
     def __init__(self, client: FnosClient):
         """
@@ -30,6 +94,13 @@ class Store:
             client: FnosClient实例
         """
         self.client = client
+        # SMART缓存：磁盘名称 -> (过期时间, 服务器返回结果)
+        self._smart_cache = {}
+    
+    async def _require_admin(self, timeout: float):
+        """需要管理员权限的接口在本地检查权限，非管理员直接抛出PermissionDenied而不访问服务器"""
+        if await self.client.check_admin(timeout) is False:
+            raise PermissionDenied("需要管理员权限")
     
     async def general(self, timeout: float = 10.0) -> dict:
         """
@@ -42,6 +113,7 @@ class Store:
             dict: 服务器返回的结果
         """
         # 使用FnoClient的新方法发送请求并等待响应
+        await self._require_admin(timeout)
         response = await self.client.request_payload_with_response("stor.general", {}, timeout)
         return response
     
@@ -56,6 +128,7 @@ class Store:
             dict: 服务器返回的结果
         """
         # 使用FnoClient的新方法发送请求并等待响应
+        await self._require_admin(timeout)
         response = await self.client.request_payload_with_response("stor.calcSpace", {}, timeout)
         return response
     
@@ -74,6 +147,7 @@ class Store:
         payload = {"noHotSpare": no_hot_spare}
         
         # 使用FnoClient的新方法发送请求并等待响应
+        await self._require_admin(timeout)
         response = await self.client.request_payload_with_response("stor.listDisk", payload, timeout)
         return response
     
@@ -90,9 +164,99 @@ class Store:
         """
         payload = {"disk": disk}
         
+        await self._require_admin(timeout)
         response = await self.client.request_payload_with_response("stor.diskSmart", payload, timeout)
         return response
     
+    async def smart_all(self, disks: list[str] = None, concurrency: int = 4, ttl: float = 300.0,
+                        refresh: bool = False, timeout: float = 10.0) -> dict:
+        """
+        并发获取所有磁盘的SMART信息
+        
+        SMART属性变化缓慢且服务端查询开销较大，成功的结果会在实例上缓存ttl秒。
+        
+        Args:
+            disks: 磁盘名称列表，默认为None（通过list_disks(no_hot_spare=False)获取全部磁盘）
+            concurrency: 同时进行的stor.diskSmart请求数上限，默认为4
+            ttl: 缓存有效期（秒），默认为300.0秒，0表示不缓存
+            refresh: 是否忽略缓存强制重新查询，默认为False
+            timeout: 单个磁盘的请求超时时间（秒），默认为10.0秒
+            
+        Returns:
+            dict: 磁盘名称 -> get_disk_smart()的返回结果；查询失败的磁盘对应抛出的异常对象
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency参数必须大于0")
+        await self._require_admin(timeout)
+        
+        if disks is None:
+            response = await self.list_disks(no_hot_spare=False, timeout=timeout)
+            if "disk" not in response:
+                raise Exception(f"获取磁盘列表失败: {response}")
+            disks = [disk["name"] for disk in response["disk"]]
+        
+        results = {}
+        now = time.monotonic()
+        pending = []
+        for disk in disks:
+            cached = self._smart_cache.get(disk)
+            if not refresh and cached is not None and cached[0] > now:
+                results[disk] = cached[1]
+            else:
+                pending.append(disk)
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch(disk: str):
+            async with semaphore:
+                return await self.get_disk_smart(disk, timeout)
+        
+        responses = await asyncio.gather(*(fetch(disk) for disk in pending), return_exceptions=True)
+        expires = time.monotonic() + ttl
+        for disk, response in zip(pending, responses):
+            if isinstance(response, asyncio.CancelledError):
+                raise response
+            if isinstance(response, Exception):
+                logger.warning(f"获取磁盘SMART信息失败: {disk}, {response}")
+            elif ttl > 0 and response.get("result") != "fail":
+                self._smart_cache[disk] = (expires, response)
+            results[disk] = response
+        
+        # 按传入顺序返回
+        return {disk: results[disk] for disk in disks}
+    
+    async def topology(self, timeout: float = 10.0) -> StorageTopology:
+        """
+        一次获取完整的存储拓扑
+        
+        并发请求stor.general、stor.calcSpace和stor.listDisk，再用一次stor.state批量查询所有存储空间的状态，
+        返回可按名称和UUID直接查找的StorageTopology。
+        
+        Args:
+            timeout: 单个请求超时时间（秒），默认为10.0秒
+            
+        Returns:
+            StorageTopology: 存储拓扑
+        """
+        general, space, disks = await asyncio.gather(
+            self.general(timeout),
+            self.calculate_space(timeout),
+            self.list_disks(no_hot_spare=False, timeout=timeout),
+        )
+        if general.get("result") != "succ":
+            raise Exception(f"获取存储通用信息失败: {general}")
+        
+        arrays = general.get("array", [])
+        state = {}
+        if arrays:
+            state = await self.get_state(
+                [item["name"] for item in arrays], [item["uuid"] for item in arrays], timeout
+            )
+            if state.get("result") != "succ":
+                logger.warning(f"获取存储状态信息失败: {state}")
+        
+        return StorageTopology(general, space, disks, state)
+    
     async def get_state(self, name: list[str], uuid: list[str], timeout: float = 10.0) -> dict:
         """
         获取存储状态信息
@@ -107,6 +271,7 @@ class Store:
         """
         payload = {"name": name, "uuid": uuid}
         
+        await self._require_admin(timeout)
         response = await self.client.request_payload_with_response("stor.state", payload, timeout)
         return response
     
@@ -0,0 +1,752 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import time
+import logging
+from array import array
+
+# 创建logger实例
+logger = logging.getLogger(__name__)
+
+# appcgi.resmon.gen 默认监控项展开后的指标名
+GENERAL_METRICS = (
+    "cpuBusy",
+    "memPercent",
+    "storeSpeed.read",
+    "storeSpeed.write",
+    "netSpeed.transmit",
+    "netSpeed.receive",
+)
+
+_NAN = float("nan")
+
+# CounterRate预设：(列表字段, 计数器字段)
+NET_COUNTERS = ("ifs", ("receive", "transmit"))
+DISK_COUNTERS = ("disk", ("read", "write"))
+
+# ContainerStatsHistory保存的指标，networkRx、networkTx为每秒速率
+CONTAINER_METRICS = ("cpuUsage", "usedMem", "networkRx", "networkTx")
+
+
+def flatten_metrics(item: dict, prefix: str = "") -> dict:
+    """将嵌套的监控项展开为 "a.b" 形式的数值字典，忽略非数值字段"""
+    result = {}
+    for key, value in item.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            result.update(flatten_metrics(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            result[name] = float(value)
+    return result
+
+
+def _percentile(sorted_values: list, q: float) -> float:
+    """线性插值计算百分位数（与numpy默认算法一致）"""
+    if not sorted_values:
+        return _NAN
+    pos = (len(sorted_values) - 1) * q / 100.0
+    lower = math.floor(pos)
+    upper = math.ceil(pos)
+    if lower == upper:
+        return sorted_values[lower]
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (pos - lower)
+
+
+class MetricBuffer:
+    def __init__(self, capacity: int, metrics: tuple = GENERAL_METRICS):
+        """
+        初始化MetricBuffer类
+
+        定长环形缓冲区，每个指标一列预分配的array('d')，外加一列时间戳。
+        每个样本每个指标只占8字节，写满后覆盖最旧的样本。缺失的值记为NaN，统计时忽略。
+
+        Args:
+            capacity: 最多保存的样本数
+            metrics: 指标名称元组，默认为appcgi.resmon.gen默认监控项展开后的指标
+        """
+        if capacity < 1:
+            raise ValueError("capacity参数必须大于0")
+        self.capacity = capacity
+        self.metrics = tuple(metrics)
+        self.timestamps = array('d', bytes(8 * capacity))
+        self.columns = {name: array('d', [_NAN]) * capacity for name in self.metrics}
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, values: dict):
+        """
+        追加一个样本
+
+        Args:
+            timestamp: 样本时间戳（秒），应单调不减
+            values: 指标名称 -> 数值，未包含的指标记为NaN
+        """
+        if self._size < self.capacity:
+            pos = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            pos = self._start
+            self._start = (self._start + 1) % self.capacity
+        self.timestamps[pos] = timestamp
+        for name, column in self.columns.items():
+            column[pos] = values.get(name, _NAN)
+
+    def append_general(self, response: dict, timestamp: float = None):
+        """
+        追加一个ResourceMonitor.general()的返回结果
+
+        Args:
+            response: ResourceMonitor.general()的返回结果
+            timestamp: 样本时间戳（秒），默认为当前时间
+        """
+        item = (response or {}).get("data", {}).get("item")
+        if item is None:
+            logger.warning(f"资源监控结果缺少 item 字段: {response}")
+            return
+        self.append(time.time() if timestamp is None else timestamp, flatten_metrics(item))
+
+    def _bisect(self, timestamp: float) -> int:
+        """返回第一个时间戳不小于timestamp的样本的逻辑序号"""
+        lo, hi = 0, self._size
+        timestamps, start, capacity = self.timestamps, self._start, self.capacity
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if timestamps[(start + mid) % capacity] < timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _slice(self, column: array, lo: int, hi: int) -> array:
+        """按逻辑序号[lo, hi)取出连续的副本"""
+        begin = (self._start + lo) % self.capacity
+        end = begin + (hi - lo)
+        if end <= self.capacity:
+            return column[begin:end]
+        return column[begin:] + column[:end - self.capacity]
+
+    def _range(self, since: float, until: float) -> tuple:
+        lo = 0 if since is None else self._bisect(since)
+        hi = self._size if until is None else self._bisect(math.nextafter(until, math.inf))
+        return lo, max(lo, hi)
+
+    def window(self, metric: str, since: float = None, until: float = None) -> tuple:
+        """
+        取出时间范围内的样本
+
+        Args:
+            metric: 指标名称
+            since: 起始时间戳（含），默认为最早的样本
+            until: 结束时间戳（含），默认为最新的样本
+
+        Returns:
+            tuple: (时间戳array, 数值array)
+        """
+        lo, hi = self._range(since, until)
+        return self._slice(self.timestamps, lo, hi), self._slice(self.columns[metric], lo, hi)
+
+    def stats(self, metric: str, since: float = None, until: float = None,
+              percentiles: tuple = ()) -> dict:
+        """
+        计算时间范围内的统计值（忽略NaN）
+
+        Args:
+            metric: 指标名称
+            since: 起始时间戳（含），默认为最早的样本
+            until: 结束时间戳（含），默认为最新的样本
+            percentiles: 需要计算的百分位数，例如(50, 95, 99)
+
+        Returns:
+            dict: 统计结果，没有有效样本时数值为NaN
+            示例:
+            {"count": 720, "min": 1.2, "max": 87.5, "mean": 13.4, "p95": 42.0}
+        """
+        _, values = self.window(metric, since, until)
+        valid = [value for value in values if value == value]
+        result = {"count": len(valid)}
+        if valid:
+            result["min"] = min(valid)
+            result["max"] = max(valid)
+            result["mean"] = math.fsum(valid) / len(valid)
+        else:
+            result["min"] = result["max"] = result["mean"] = _NAN
+        if percentiles:
+            valid.sort()
+            for q in percentiles:
+                result[f"p{q:g}"] = _percentile(valid, q)
+        return result
+
+    def percentile(self, metric: str, q: float, since: float = None, until: float = None) -> float:
+        """计算时间范围内的百分位数（忽略NaN）"""
+        _, values = self.window(metric, since, until)
+        return _percentile(sorted(value for value in values if value == value), q)
+
+    def downsample(self, metric: str, bucket: float, agg: str = "mean",
+                   since: float = None, until: float = None) -> tuple:
+        """
+        按固定时间桶降采样
+
+        Args:
+            metric: 指标名称
+            bucket: 时间桶宽度（秒），桶按时间戳的整数倍对齐
+            agg: 聚合方式，可选值为"mean"、"min"、"max"、"last"，默认为"mean"
+            since: 起始时间戳（含），默认为最早的样本
+            until: 结束时间戳（含），默认为最新的样本
+
+        Returns:
+            tuple: (桶起始时间戳array, 聚合值array)，没有有效样本的桶不输出
+        """
+        if bucket <= 0:
+            raise ValueError("bucket参数必须大于0")
+        reducers = {
+            "mean": lambda values: math.fsum(values) / len(values),
+            "min": min,
+            "max": max,
+            "last": lambda values: values[-1],
+        }
+        if agg not in reducers:
+            raise ValueError("agg参数必须为mean、min、max或last")
+        reduce = reducers[agg]
+
+        timestamps, values = self.window(metric, since, until)
+        out_times = array('d')
+        out_values = array('d')
+        current = None
+        pending = []
+        for timestamp, value in zip(timestamps, values):
+            key = math.floor(timestamp / bucket) * bucket
+            if key != current:
+                if pending:
+                    out_times.append(current)
+                    out_values.append(reduce(pending))
+                current = key
+                pending = []
+            if value == value:
+                pending.append(value)
+        if pending:
+            out_times.append(current)
+            out_values.append(reduce(pending))
+        return out_times, out_values
+
+
+class CounterRate:
+    def __init__(self, list_key: str, fields: tuple, wrap: float = 2 ** 64):
+        """
+        初始化CounterRate类
+
+        将appcgi.resmon.net、appcgi.resmon.disk等接口返回的累计计数器换算为每秒速率。
+        上一次的计数器和计算出的速率保存在按设备编号排列的array('d')中，
+        每次更新原地覆盖，不为每个样本分配新的dict。
+
+        Args:
+            list_key: 响应data中设备列表的字段名，例如"ifs"或"disk"
+            fields: 需要计算速率的计数器字段名，例如("receive", "transmit")
+            wrap: 计数器的回绕上限，默认为2**64；计数器减小且降幅超过wrap的一半时按回绕处理，否则按重置处理
+        """
+        self.list_key = list_key
+        self.fields = tuple(fields)
+        self.wrap = wrap
+        self.names = []
+        self.rates = array('d')
+        self._index = {}
+        self._previous = array('d')
+        self._timestamps = array('d')
+        self._has_previous = bytearray()
+
+    @classmethod
+    def for_net(cls, wrap: float = 2 ** 64) -> "CounterRate":
+        """创建用于ResourceMonitor.net()的实例（按接口计算receive、transmit速率）"""
+        list_key, fields = NET_COUNTERS
+        return cls(list_key, fields, wrap)
+
+    @classmethod
+    def for_disk(cls, wrap: float = 2 ** 64) -> "CounterRate":
+        """创建用于ResourceMonitor.disk()的实例（按磁盘计算read、write速率）"""
+        list_key, fields = DISK_COUNTERS
+        return cls(list_key, fields, wrap)
+
+    def _slot(self, name: str) -> int:
+        slot = self._index.get(name)
+        if slot is None:
+            slot = len(self.names)
+            self._index[name] = slot
+            self.names.append(name)
+            width = len(self.fields)
+            self.rates.extend([_NAN] * width)
+            self._previous.extend([0.0] * width)
+            self._timestamps.append(0.0)
+            self._has_previous.append(0)
+        return slot
+
+    def update(self, response: dict, timestamp: float = None) -> int:
+        """
+        用一次接口返回结果更新速率
+
+        设备第一次出现时只记录计数器，速率为NaN；本次未出现的设备保留上一次的速率。
+
+        Args:
+            response: ResourceMonitor.net()或disk()的返回结果
+            timestamp: 采样时间戳（秒），默认为当前时间
+
+        Returns:
+            int: 本次更新的设备数
+        """
+        items = (response or {}).get("data", {}).get(self.list_key)
+        if items is None:
+            logger.warning(f"资源监控结果缺少 {self.list_key} 字段: {response}")
+            return 0
+        if timestamp is None:
+            timestamp = time.time()
+
+        fields = self.fields
+        width = len(fields)
+        wrap = self.wrap
+        half_wrap = wrap / 2 if wrap else None
+        rates, previous = self.rates, self._previous
+        for item in items:
+            slot = self._slot(item["name"])
+            base = slot * width
+            elapsed = timestamp - self._timestamps[slot]
+            usable = self._has_previous[slot] and elapsed > 0
+            for offset, field in enumerate(fields):
+                current = float(item.get(field, 0))
+                if usable:
+                    last = previous[base + offset]
+                    delta = current - last
+                    if delta < 0:
+                        # 计数器回绕或重置
+                        delta = current + wrap - last if half_wrap and last - current > half_wrap else current
+                    rates[base + offset] = delta / elapsed
+                else:
+                    rates[base + offset] = _NAN
+                previous[base + offset] = current
+            self._timestamps[slot] = timestamp
+            self._has_previous[slot] = 1
+        return len(items)
+
+    def rate(self, name: str, field: str) -> float:
+        """获取指定设备、指定字段的最新速率（每秒），尚无速率时为NaN"""
+        return self.rates[self._index[name] * len(self.fields) + self.fields.index(field)]
+
+    def items(self):
+        """遍历(设备名称, 各字段速率元组)"""
+        width = len(self.fields)
+        rates = self.rates
+        for slot, name in enumerate(self.names):
+            yield name, tuple(rates[slot * width:(slot + 1) * width])
+
+
+class _EwmaState:
+    """单个指标的EWMA状态"""
+    __slots__ = ("mean", "var", "count", "active")
+
+    def __init__(self):
+        self.mean = 0.0
+        self.var = 0.0
+        self.count = 0
+        self.active = False
+
+
+class AnomalyDetector:
+    def __init__(self, alpha: float = 0.1, z_enter: float = 3.0, z_exit: float = 2.0,
+                 thresholds: dict = None, warmup: int = 10):
+        """
+        初始化AnomalyDetector类
+
+        为每个指标增量维护指数加权移动平均（EWMA）的均值和方差，每个指标只占常数内存，
+        每个样本的处理时间为O(1)。z-score或固定阈值越界时产出告警事件，并用进入/退出两个阈值实现滞回，
+        避免数值在阈值附近抖动时反复告警。
+
+        Args:
+            alpha: EWMA平滑系数，取值(0, 1]，越大对新样本越敏感，默认为0.1
+            z_enter: z-score达到该值时进入告警，默认为3.0
+            z_exit: z-score低于该值时退出告警，默认为2.0
+            thresholds: 固定阈值，指标名称 -> (进入告警阈值, 退出告警阈值)，例如{"cpuBusy": (90, 80)}
+            warmup: 指标累计样本数达到该值之前不做z-score判断，默认为10
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha参数必须在(0, 1]之间")
+        if z_exit > z_enter:
+            raise ValueError("z_exit参数不能大于z_enter")
+        self.alpha = alpha
+        self.z_enter = z_enter
+        self.z_exit = z_exit
+        self.thresholds = dict(thresholds or {})
+        self.warmup = warmup
+        self._states = {}
+
+    def state(self, metric: str) -> dict:
+        """
+        获取指标当前的EWMA状态
+
+        Returns:
+            dict: {"mean": 均值, "std": 标准差, "count": 样本数, "active": 是否处于告警中}，未见过的指标返回None
+        """
+        state = self._states.get(metric)
+        if state is None:
+            return None
+        return {"mean": state.mean, "std": math.sqrt(state.var), "count": state.count, "active": state.active}
+
+    def update(self, values: dict, timestamp: float = None) -> list:
+        """
+        输入一个样本，返回告警状态发生变化的事件
+
+        z-score按更新前的均值和方差计算，避免异常值稀释自身。
+
+        Args:
+            values: 指标名称 -> 数值
+            timestamp: 样本时间戳（秒），默认为当前时间
+
+        Returns:
+            list: 事件列表，没有状态变化时为空列表
+            示例:
+            [
+              {
+                "metric": "cpuBusy",
+                "type": "breach", // breach进入告警，recover退出告警
+                "reason": "zscore", // zscore或threshold
+                "value": 97.0,
+                "mean": 12.5,
+                "std": 3.1,
+                "z": 27.3,
+                "timestamp": 1770444495.0
+              }
+            ]
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        events = []
+        alpha = self.alpha
+        for metric, value in values.items():
+            if value != value:
+                continue
+            state = self._states.get(metric)
+            if state is None:
+                state = self._states[metric] = _EwmaState()
+
+            std = math.sqrt(state.var)
+            warmed = state.count >= self.warmup
+            z = (value - state.mean) / std if warmed and std > 0 else 0.0
+            threshold = self.thresholds.get(metric)
+
+            if not state.active:
+                reason = None
+                if warmed and abs(z) >= self.z_enter:
+                    reason = "zscore"
+                elif threshold is not None and value >= threshold[0]:
+                    reason = "threshold"
+                if reason is not None:
+                    state.active = True
+                    events.append(self._event(metric, "breach", reason, value, state.mean, std, z, timestamp))
+            else:
+                z_ok = not warmed or abs(z) < self.z_exit
+                threshold_ok = threshold is None or value < threshold[1]
+                if z_ok and threshold_ok:
+                    state.active = False
+                    events.append(self._event(metric, "recover", None, value, state.mean, std, z, timestamp))
+
+            # 增量更新EWMA均值和方差
+            if state.count == 0:
+                state.mean = value
+            else:
+                diff = value - state.mean
+                increment = alpha * diff
+                state.mean += increment
+                state.var = (1 - alpha) * (state.var + diff * increment)
+            state.count += 1
+        return events
+
+    def update_general(self, response: dict, timestamp: float = None) -> list:
+        """输入一个ResourceMonitor.general()的返回结果，指标名称同flatten_metrics()"""
+        item = (response or {}).get("data", {}).get("item")
+        if item is None:
+            logger.warning(f"资源监控结果缺少 item 字段: {response}")
+            return []
+        return self.update(flatten_metrics(item), timestamp)
+
+    @staticmethod
+    def _event(metric, kind, reason, value, mean, std, z, timestamp) -> dict:
+        return {
+            "metric": metric,
+            "type": kind,
+            "reason": reason,
+            "value": value,
+            "mean": mean,
+            "std": std,
+            "z": z,
+            "timestamp": timestamp,
+        }
+
+class ContainerStatsHistory:
+    def __init__(self, capacity: int, expire_after: float = 300.0):
+        """
+        初始化ContainerStatsHistory类
+
+        保存DockerManager.stats()的历史。容器ID映射为稠密的槽位编号，每个指标一列按槽位分段的array('d')，
+        所有容器共用一列时间戳环形缓冲区。networkRx、networkTx保存为由累计计数器换算出的每秒速率。
+        被删除的容器超过expire_after秒未出现后释放槽位，供新容器复用。
+
+        Args:
+            capacity: 每个容器最多保存的样本数
+            expire_after: 容器超过该秒数未出现时删除其历史，默认为300.0秒，为None表示不自动删除
+        """
+        if capacity < 1:
+            raise ValueError("capacity参数必须大于0")
+        self.capacity = capacity
+        self.expire_after = expire_after
+        self.metrics = CONTAINER_METRICS
+        self.timestamps = array('d', bytes(8 * capacity))
+        self.columns = {name: array('d') for name in self.metrics}
+        self.ids = []
+        self._index = {}
+        self._free = []
+        self._projects = {}
+        self._last_seen = array('d')
+        self._previous = array('d')
+        self._has_previous = bytearray()
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, container_id: str) -> bool:
+        return container_id in self._index
+
+    def _slot(self, container_id: str) -> int:
+        slot = self._index.get(container_id)
+        if slot is not None:
+            return slot
+        if self._free:
+            slot = self._free.pop()
+            self.ids[slot] = container_id
+            begin = slot * self.capacity
+            for column in self.columns.values():
+                column[begin:begin + self.capacity] = array('d', [_NAN]) * self.capacity
+            self._has_previous[slot] = 0
+        else:
+            slot = len(self.ids)
+            self.ids.append(container_id)
+            for column in self.columns.values():
+                column.extend(array('d', [_NAN]) * self.capacity)
+            self._last_seen.append(0.0)
+            self._previous.extend((0.0, 0.0))
+            self._has_previous.append(0)
+        self._index[container_id] = slot
+        return slot
+
+    def set_projects(self, response: dict):
+        """
+        用DockerManager.list_containers()的返回结果更新容器所属的Compose项目
+
+        Args:
+            response: DockerManager.list_containers()的返回结果
+        """
+        containers = (response or {}).get("rsp")
+        if containers is None:
+            logger.warning(f"容器列表结果缺少 rsp 字段: {response}")
+            return
+        self._projects = {container["Id"]: container.get("Project") or "" for container in containers}
+
+    def project_of(self, container_id: str) -> str:
+        """获取容器所属的Compose项目，未知时为空字符串"""
+        return self._projects.get(container_id, "")
+
+    def update(self, response: dict, timestamp: float = None) -> int:
+        """
+        追加一次DockerManager.stats()的返回结果
+
+        本次未出现的容器在该时刻记为NaN；容器第一次出现或网络计数器变小（容器重启）时，网络速率记为NaN。
+
+        Args:
+            response: DockerManager.stats()的返回结果
+            timestamp: 采样时间戳（秒），应单调不减，默认为当前时间
+
+        Returns:
+            int: 本次更新的容器数
+        """
+        stats = (response or {}).get("rsp")
+        if stats is None:
+            logger.warning(f"容器统计结果缺少 rsp 字段: {response}")
+            return 0
+        if timestamp is None:
+            timestamp = time.time()
+
+        capacity = self.capacity
+        previous_pos = (self._start + self._size - 1) % capacity if self._size else None
+        previous_time = self.timestamps[previous_pos] if previous_pos is not None else None
+        if self._size < capacity:
+            pos = (self._start + self._size) % capacity
+            self._size += 1
+        else:
+            pos = self._start
+            self._start = (self._start + 1) % capacity
+        self.timestamps[pos] = timestamp
+        for column in self.columns.values():
+            for slot in range(len(self.ids)):
+                column[slot * capacity + pos] = _NAN
+
+        cpu, mem = self.columns["cpuUsage"], self.columns["usedMem"]
+        rx_rate, tx_rate = self.columns["networkRx"], self.columns["networkTx"]
+        previous = self._previous
+        for container_id, item in stats.items():
+            slot = self._slot(container_id)
+            offset = slot * capacity + pos
+            cpu[offset] = float(item.get("cpuUsage", _NAN))
+            mem[offset] = float(item.get("usedMem", _NAN))
+            rx, tx = float(item.get("networkRx", 0)), float(item.get("networkTx", 0))
+            last_seen = self._last_seen[slot]
+            if self._has_previous[slot] and last_seen == previous_time and timestamp > last_seen:
+                elapsed = timestamp - last_seen
+                last_rx, last_tx = previous[2 * slot], previous[2 * slot + 1]
+                rx_rate[offset] = (rx - last_rx) / elapsed if rx >= last_rx else _NAN
+                tx_rate[offset] = (tx - last_tx) / elapsed if tx >= last_tx else _NAN
+            previous[2 * slot] = rx
+            previous[2 * slot + 1] = tx
+            self._has_previous[slot] = 1
+            self._last_seen[slot] = timestamp
+
+        if self.expire_after is not None:
+            self.expire(timestamp - self.expire_after)
+        return len(stats)
+
+    def expire(self, before: float) -> list:
+        """
+        删除最后出现时间早于before的容器的历史
+
+        Args:
+            before: 时间戳（秒）
+
+        Returns:
+            list: 被删除的容器ID列表
+        """
+        removed = []
+        for slot, container_id in enumerate(self.ids):
+            if container_id is not None and self._last_seen[slot] < before:
+                del self._index[container_id]
+                self.ids[slot] = None
+                self._free.append(slot)
+                removed.append(container_id)
+        return removed
+
+    def _bisect(self, timestamp: float) -> int:
+        """返回第一个时间戳不小于timestamp的样本的逻辑序号"""
+        lo, hi = 0, self._size
+        timestamps, start, capacity = self.timestamps, self._start, self.capacity
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if timestamps[(start + mid) % capacity] < timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _positions(self, since: float, until: float) -> list:
+        """返回时间范围内样本的物理位置列表（按时间顺序）"""
+        lo = 0 if since is None else self._bisect(since)
+        hi = self._size if until is None else self._bisect(math.nextafter(until, math.inf))
+        return [(self._start + i) % self.capacity for i in range(lo, hi)]
+
+    def series(self, container_id: str, metric: str, since: float = None, until: float = None) -> tuple:
+        """
+        取出一个容器在时间范围内的样本
+
+        Args:
+            container_id: 容器ID
+            metric: 指标名称，可选值为cpuUsage、usedMem、networkRx、networkTx（后两者为每秒速率）
+            since: 起始时间戳（含），默认为最早的样本
+            until: 结束时间戳（含），默认为最新的样本
+
+        Returns:
+            tuple: (时间戳array, 数值array)
+        """
+        base = self._index[container_id] * self.capacity
+        column = self.columns[metric]
+        positions = self._positions(since, until)
+        return (array('d', (self.timestamps[pos] for pos in positions)),
+                array('d', (column[base + pos] for pos in positions)))
+
+    def latest(self, container_id: str) -> dict:
+        """获取一个容器最新一次样本的各指标值，容器本次未出现时各值为NaN"""
+        if not self._size:
+            return {name: _NAN for name in self.metrics}
+        offset = self._index[container_id] * self.capacity + (self._start + self._size - 1) % self.capacity
+        return {name: column[offset] for name, column in self.columns.items()}
+
+    def project_series(self, metric: str, since: float = None, until: float = None) -> dict:
+        """
+        按Compose项目汇总时间范围内的样本，每个时刻对项目内各容器求和（忽略NaN）
+
+        未归属任何项目的容器汇总在空字符串项目下。
+
+        Args:
+            metric: 指标名称
+            since: 起始时间戳（含），默认为最早的样本
+            until: 结束时间戳（含），默认为最新的样本
+
+        Returns:
+            dict: 项目名称 -> (时间戳array, 汇总值array)
+        """
+        positions = self._positions(since, until)
+        timestamps = array('d', (self.timestamps[pos] for pos in positions))
+        column = self.columns[metric]
+        capacity = self.capacity
+        totals = {}
+        for slot, container_id in enumerate(self.ids):
+            if container_id is None:
+                continue
+            project = self._projects.get(container_id, "")
+            total = totals.get(project)
+            if total is None:
+                total = totals[project] = array('d', bytes(8 * len(positions)))
+            base = slot * capacity
+            for i, pos in enumerate(positions):
+                value = column[base + pos]
+                if value == value:
+                    total[i] += value
+        return {project: (timestamps, total) for project, total in totals.items()}
+
+    def project_latest(self) -> dict:
+        """
+        按Compose项目汇总最新一次样本（忽略NaN）
+
+        Returns:
+            dict: 项目名称 -> {指标名称: 汇总值, "containers": 本次出现的容器数}
+        """
+        result = {}
+        if not self._size:
+            return result
+        pos = (self._start + self._size - 1) % self.capacity
+        for slot, container_id in enumerate(self.ids):
+            if container_id is None:
+                continue
+            project = self._projects.get(container_id, "")
+            totals = result.get(project)
+            if totals is None:
+                totals = result[project] = dict.fromkeys(self.metrics, 0.0)
+                totals["containers"] = 0
+            offset = slot * self.capacity + pos
+            seen = False
+            for name, column in self.columns.items():
+                value = column[offset]
+                if value == value:
+                    totals[name] += value
+                    seen = True
+            if seen:
+                totals["containers"] += 1
+        return result
@@ -92,4 +92,6 @@ class User:
         payload = {}
         # 使用FnoClient的新方法发送请求并等待响应
         response = await self.client.request_payload_with_response("user.isAdmin", payload, timeout)
+        # 顺便缓存到客户端，供需要管理员权限的接口在本地判断
+        self.client._update_admin(response)
         return response
\ No newline at end of file
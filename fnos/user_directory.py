@@ -0,0 +1,165 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import asyncio
+import logging
+from .client import FnosClient
+from .user import User
+
+# 创建logger实例
+logger = logging.getLogger(__name__)
+
+
+class _Indexes:
+    """一次加载得到的全部索引，整体替换以保证查询看到的是一致的快照"""
+
+    def __init__(self, user_groups: dict, group_users: dict):
+        self.users_by_uid = {}
+        self.users_by_name = {}
+        self.groups_by_gid = {}
+        self.groups_by_name = {}
+        self.gids_of_user = {}
+        self.uids_of_group = {}
+
+        for user in user_groups.get("users") or []:
+            self.users_by_uid[user["uid"]] = user
+            self.users_by_name[user["user"]] = user
+        for group in user_groups.get("groups") or []:
+            self.groups_by_gid[group["gid"]] = group
+            self.groups_by_name[group["group"]] = group
+        for group in group_users.get("groups") or []:
+            gid = group["gid"]
+            self.groups_by_gid.setdefault(gid, group)
+            self.groups_by_name.setdefault(group["group"], group)
+            uids = frozenset(group.get("users") or [])
+            self.uids_of_group[gid] = uids
+            for uid in uids:
+                self.gids_of_user.setdefault(uid, set()).add(gid)
+
+
+class UserDirectory:
+    def __init__(self, client: FnosClient, ttl: float = 300.0):
+        """
+        初始化UserDirectory类
+
+        并发加载user.listUG和user.groupUsers，建立uid/用户名 -> 用户、gid/组名 -> 组、
+        用户 -> 组、组 -> 用户的索引。成员关系查询在本地O(1)完成，不需要请求NAS。
+        start()后按TTL在后台刷新，刷新失败时继续使用上一次的结果。
+
+        Args:
+            client: FnosClient实例
+            ttl: 索引的有效期（秒），也是后台刷新的间隔，默认为300.0秒
+        """
+        if ttl <= 0:
+            raise ValueError("ttl参数必须大于0")
+        self.client = client
+        self.user = User(client)
+        self.ttl = ttl
+        self.loaded_at = None
+        self._indexes = _Indexes({}, {})
+        self._load_lock = asyncio.Lock()
+        self._task = None
+
+    @property
+    def stale(self) -> bool:
+        """索引是否从未加载或已超过TTL"""
+        return self.loaded_at is None or time.monotonic() - self.loaded_at >= self.ttl
+
+    async def load(self, timeout: float = 10.0):
+        """
+        立即重新加载用户和组
+
+        Args:
+            timeout: 单个请求超时时间（秒），默认为10.0秒
+        """
+        async with self._load_lock:
+            user_groups, group_users = await asyncio.gather(
+                self.user.listUserGroups(timeout),
+                self.user.groupUsers(timeout),
+            )
+            if user_groups.get("result") != "succ":
+                raise Exception(f"获取用户和组列表失败: {user_groups}")
+            if group_users.get("result") != "succ":
+                raise Exception(f"获取用户分组信息失败: {group_users}")
+            self._indexes = _Indexes(user_groups, group_users)
+            self.loaded_at = time.monotonic()
+
+    async def ensure_loaded(self, timeout: float = 10.0):
+        """索引过期时重新加载"""
+        if self.stale:
+            await self.load(timeout)
+
+    async def _refresh_loop(self, timeout: float):
+        while True:
+            await asyncio.sleep(self.ttl)
+            try:
+                await self.load(timeout)
+            except Exception as e:
+                logger.warning(f"刷新用户目录失败: {e}")
+
+    async def start(self, timeout: float = 10.0):
+        """加载一次索引，并启动按TTL刷新的后台任务"""
+        await self.load(timeout)
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop(timeout))
+
+    async def stop(self):
+        """停止后台刷新任务"""
+        if self._task is not None:
+            task, self._task = self._task, None
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def get_user(self, key) -> dict:
+        """按uid（int）或用户名（str）获取用户，不存在时返回None"""
+        indexes = self._indexes
+        if isinstance(key, int):
+            return indexes.users_by_uid.get(key)
+        return indexes.users_by_name.get(key)
+
+    def get_group(self, key) -> dict:
+        """按gid（int）或组名（str）获取组，不存在时返回None"""
+        indexes = self._indexes
+        if isinstance(key, int):
+            return indexes.groups_by_gid.get(key)
+        return indexes.groups_by_name.get(key)
+
+    def _uid(self, user) -> int:
+        if isinstance(user, int):
+            return user
+        found = self._indexes.users_by_name.get(user)
+        return found["uid"] if found is not None else None
+
+    def _gid(self, group) -> int:
+        if isinstance(group, int):
+            return group
+        found = self._indexes.groups_by_name.get(group)
+        return found["gid"] if found is not None else None
+
+    def groups_of(self, user) -> list:
+        """获取用户（uid或用户名）所属的组列表"""
+        indexes = self._indexes
+        gids = indexes.gids_of_user.get(self._uid(user), ())
+        return [indexes.groups_by_gid[gid] for gid in gids if gid in indexes.groups_by_gid]
+
+    def users_of(self, group) -> list:
+        """获取组（gid或组名）中的用户列表"""
+        indexes = self._indexes
+        uids = indexes.uids_of_group.get(self._gid(group), ())
+        return [indexes.users_by_uid[uid] for uid in uids if uid in indexes.users_by_uid]
+
+    def is_member(self, user, group) -> bool:
+        """判断用户（uid或用户名）是否属于组（gid或组名）"""
+        return self._uid(user) in self._indexes.uids_of_group.get(self._gid(group), ())
@@ -176,5 +176,457 @@ class TestFnosClient(unittest.TestCase):
         # 运行异步测试
         asyncio.run(run_test())
 
+    def test_raw_response_routes_without_parsing(self):
+        """测试raw请求的响应以原始字符串传递给对应的future"""
+        import asyncio
+        import json
+
+        async def run_test():
+            client = FnosClient()
+
+            future = asyncio.Future()
+            test_reqid = "1234567890123abcdefabcdef"
+            client.pending_requests[test_reqid] = {
+                'future': future,
+                'req': 'file.ls',
+                'payload': {}
+            }
+            client.raw_response_reqids.add(test_reqid)
+
+            # 文件名中包含转义后的reqid字样，不应被误识别
+            message = json.dumps({
+                "files": [{"name": '"reqid":"fake"', "size": 1}],
+                "uver": 1,
+                "reqid": test_reqid
+            })
+            await client._process_message(message)
+
+            self.assertTrue(future.done(), "Future应该被设置为完成状态")
+            self.assertEqual(future.result(), message)
+            self.assertNotIn(test_reqid, client.pending_requests)
+            self.assertNotIn(test_reqid, client.raw_response_reqids)
+
+        asyncio.run(run_test())
+
+    def test_admin_only_request_short_circuit(self):
+        """测试非管理员调用Store接口时在本地抛出PermissionDenied"""
+        import asyncio
+        from fnos import Store, PermissionDenied
+
+        async def run_test():
+            client = FnosClient()
+            client.connected = True
+            client.is_admin = False
+
+            with self.assertRaises(PermissionDenied):
+                await Store(client).general()
+
+            # 不应发出任何请求
+            self.assertEqual(client.pending_requests, {})
+
+        asyncio.run(run_test())
+
+    def test_admin_unknown_when_check_fails(self):
+        """测试user.isAdmin失败时返回None并在本会话内缓存，不阻止实际请求"""
+        import asyncio
+
+        async def run_test():
+            client = FnosClient()
+            calls = []
+
+            async def fake_request(req, payload, timeout=10.0, raw=False):
+                calls.append(req)
+                if req == "user.isAdmin":
+                    raise Exception("请求超时")
+                return {"result": "succ"}
+
+            client.request_payload_with_response = fake_request
+            self.assertIsNone(await client.check_admin())
+            self.assertIsNone(await client.check_admin())
+            self.assertEqual(calls, ["user.isAdmin"])
+
+            from fnos import Store
+            response = await Store(client).general()
+            self.assertEqual(response["result"], "succ")
+            self.assertEqual(calls, ["user.isAdmin", "stor.general"])
+
+        asyncio.run(run_test())
+
+    def test_admin_cache_invalidated_on_login(self):
+        """测试重新登录时管理员状态缓存失效"""
+        import asyncio
+
+        async def run_test():
+            client = FnosClient()
+            client._update_admin({"result": "succ", "admin": False})
+            self.assertFalse(client.is_admin)
+
+            client.connected = True
+            client.public_key = "invalid"
+            client.session_id = "si"
+            with self.assertRaises(Exception):
+                await client.login("user", "password")
+            self.assertIsNone(client.is_admin)
+
+        asyncio.run(run_test())
+
+    def test_push_listener_consumes_frame(self):
+        """测试不带reqid的推送消息交给推送监听函数，不再被当作待处理请求的响应"""
+        import asyncio
+        import json
+
+        async def run_test():
+            client = FnosClient()
+
+            future = asyncio.Future()
+            client.pending_requests["1234567890123abcdefabcdef"] = {
+                'future': future,
+                'req': 'notify.unreadTotal',
+                'payload': {}
+            }
+            received = []
+
+            def listener(data):
+                received.append(data)
+                return "unreadTotal" in data
+
+            client.add_push_listener(listener)
+            await client._process_message(json.dumps({"req": "notify.push", "unreadTotal": 3}))
+            self.assertEqual(received, [{"req": "notify.push", "unreadTotal": 3}])
+            self.assertFalse(future.done(), "已处理的推送消息不应交给待处理请求")
+
+            # 未处理的推送消息保持原有行为
+            client.remove_push_listener(listener)
+            await client._process_message(json.dumps({"other": 1}))
+            self.assertTrue(future.done())
+
+        asyncio.run(run_test())
+
+    def test_iter_list_matches_top_level_files_key(self):
+        """测试iter_list只匹配顶层的files键，不会误用值或嵌套对象中的"files"字符串"""
+        import asyncio
+        from fnos import File
+
+        message = (
+            '{"note": "files", "other": ["decoy"], "meta": {"files": [{"name": "nested"}]},'
+            ' "files": [{"name": "a.txt", "size": 1}, {"name": "b", "dir": 1}], "uver": 1, "result": "succ"}'
+        )
+
+        async def fake_request(req, payload, timeout=10.0, raw=False):
+            self.assertTrue(raw)
+            return message
+
+        async def run_test():
+            client = FnosClient()
+            client.request_payload_with_response = fake_request
+            names = [entry["name"] async for entry in File(client).iter_list("vol1/1000")]
+            self.assertEqual(names, ["a.txt", "b"])
+
+        asyncio.run(run_test())
+
+    def test_watch_relists_after_failed_first_snapshot(self):
+        """测试首次列出目录失败后，watch仍会建立基准并产出之后的变化"""
+        import asyncio
+        from fnos import File
+
+        state = {"uver": 1, "files": [{"name": "old.txt", "size": 1}], "calls": 0}
+
+        async def fake_get_acl(files, timeout=10.0):
+            return {"result": "succ", "uver": state["uver"]}
+
+        async def fake_list(path, timeout=10.0):
+            state["calls"] += 1
+            if state["calls"] == 1:
+                raise Exception("请求 file.ls 超时")
+            response = {"result": "succ", "uver": state["uver"], "files": list(state["files"])}
+            if state["calls"] == 2:
+                # 建立基准之后新建文件
+                state["uver"] = 2
+                state["files"] = state["files"] + [{"name": "new.txt", "size": 2}]
+            return response
+
+        async def run_test():
+            file_obj = File(FnosClient())
+            file_obj.get_acl = fake_get_acl
+            file_obj.list = fake_list
+
+            async def first_event():
+                async for event in file_obj.watch("vol1/1000/a", interval=0.01):
+                    return event
+
+            event = await asyncio.wait_for(first_event(), timeout=2.0)
+            self.assertEqual((event["type"], event["name"]), ("created", "new.txt"))
+
+        asyncio.run(run_test())
+
+    def test_du_rechecks_unchanged_parent_subtree(self):
+        """测试上级目录uver未变化时，du仍会发现下级目录的变化"""
+        import asyncio
+        from fnos import File
+
+        tree = {
+            "vol1/1000/a": {"uver": 1, "files": [{"name": "b", "dir": 1}, {"name": "x", "size": 10}]},
+            "vol1/1000/a/b": {"uver": 2, "files": [{"name": "y", "size": 20}]},
+        }
+
+        async def fake_list(path, timeout=10.0):
+            return dict(tree[path], result="succ")
+
+        async def run_test():
+            file_obj = File(FnosClient())
+            file_obj.list = fake_list
+
+            usage = await file_obj.du("vol1/1000/a")
+            self.assertEqual(usage.total, 30)
+
+            # 只有子目录的uver变化
+            tree["vol1/1000/a/b"] = {"uver": 3, "files": [{"name": "y", "size": 20}, {"name": "z", "size": 5}]}
+            usage = await file_obj.du("vol1/1000/a")
+            self.assertEqual(usage.total, 35)
+            self.assertEqual(usage.get("vol1/1000/a/b")["files"], 2)
+
+        asyncio.run(run_test())
+
+    def test_du_records_list_errors(self):
+        """测试单个目录请求出错时记录到errors，不中断整个统计"""
+        import asyncio
+        from fnos import File
+
+        tree = {
+            "r": {"uver": 1, "files": [{"name": "slow", "dir": 1}, {"name": "ok", "dir": 1}, {"name": "x", "size": 1}]},
+            "r/ok": {"uver": 2, "files": [{"name": "y", "size": 2}]},
+        }
+
+        async def fake_list(path, timeout=10.0):
+            if path == "r/slow":
+                raise Exception("请求 file.ls 超时")
+            return dict(tree[path], result="succ")
+
+        async def run_test():
+            file_obj = File(FnosClient())
+            file_obj.list = fake_list
+
+            usage = await file_obj.du("r")
+            self.assertEqual(usage.total, 3)
+            self.assertIn("r/ok", usage)
+            self.assertNotIn("r/slow", usage)
+            self.assertEqual([path for path, _ in usage.errors], ["r/slow"])
+            self.assertIsInstance(usage.errors[0][1], Exception)
+
+        asyncio.run(run_test())
+
+    def test_file_index_crawl_descends_unchanged_dirs(self):
+        """测试上级目录uver未变化时，crawl仍会深入并刷新变化的子目录"""
+        import asyncio
+        from fnos import FileIndex
+
+        tree = {
+            "vol1/1000/a": {"uver": 1, "files": [{"name": "b", "dir": 1}]},
+            "vol1/1000/a/b": {"uver": 2, "files": [{"name": "old.txt", "size": 1}]},
+        }
+
+        async def fake_list(path, timeout=10.0):
+            return dict(tree[path], result="succ")
+
+        async def run_test():
+            index = FileIndex(FnosClient(), ":memory:")
+            index.file.list = fake_list
+            try:
+                await index.crawl("vol1/1000/a")
+
+                tree["vol1/1000/a/b"] = {"uver": 3, "files": [{"name": "new.txt", "size": 2}]}
+                stats = await index.crawl("vol1/1000/a")
+                self.assertEqual(stats["unchanged"], 1)
+                self.assertEqual(stats["updated"], 1)
+                names = [row["name"] for row in index.search(under="vol1/1000/a/b")]
+                self.assertEqual(names, ["new.txt"])
+            finally:
+                index.close()
+
+        asyncio.run(run_test())
+
+    def test_exporter_reconnects_once(self):
+        """测试多个指标族同时发现断开时只调用一次reconnect()"""
+        import asyncio
+        from fnos import PrometheusExporter
+
+        async def run_test():
+            client = FnosClient()
+            client.username = "user"
+            client.password = "password"
+            calls = []
+
+            async def fake_reconnect():
+                calls.append(1)
+                await asyncio.sleep(0.01)
+                client.connected = True
+                return True
+
+            client.reconnect = fake_reconnect
+            exporter = PrometheusExporter(client)
+            results = await asyncio.gather(*(exporter._ensure_connected() for _ in range(5)))
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(results, [True, False, False, False, False])
+            self.assertTrue(await exporter._ensure_connected())
+
+            # token登录的会话不尝试重连
+            client.connected = False
+            client.password = None
+            self.assertFalse(await exporter._ensure_connected())
+            self.assertEqual(len(calls), 1)
+
+        asyncio.run(run_test())
+
+    def test_common_list_keeps_positional_timeout(self):
+        """测试common_list的第一个位置参数仍为timeout，未指定分页参数时请求内容不变"""
+        import asyncio
+        from fnos import EventLogger
+
+        async def run_test():
+            client = FnosClient()
+            sent = []
+
+            async def fake_request(req, payload, timeout=10.0, raw=False):
+                sent.append((req, payload, timeout))
+                return {"result": "succ", "data": {"total": 0, "rows": []}}
+
+            client.request_payload_with_response = fake_request
+            event_logger = EventLogger(client)
+            await event_logger.common_list(5.0)
+            await event_logger.common_list(offset=10, limit=5)
+            self.assertEqual(sent[0][1:], ({}, 5.0))
+            self.assertEqual(sent[1][1:], ({"offset": 10, "limit": 5}, 10.0))
+
+        asyncio.run(run_test())
+
+    def test_iter_events_raises_on_repeated_page(self):
+        """测试服务器忽略offset重复返回同一页时，iter_events抛出异常而不是当作读取结束"""
+        import asyncio
+        from fnos import EventLogger
+
+        page = {"result": "succ", "data": {"total": 10, "rows": [{"id": 10}, {"id": 9}]}}
+
+        async def run_test():
+            event_logger = EventLogger(FnosClient())
+
+            async def fake_common_list(*args, **kwargs):
+                return page
+
+            event_logger.common_list = fake_common_list
+            ids = []
+            with self.assertRaises(Exception):
+                async for row in event_logger.iter_events(page_size=2):
+                    ids.append(row["id"])
+            self.assertEqual(ids, [10, 9])
+
+        asyncio.run(run_test())
+
+    def test_tail_keeps_cursor_after_broken_paging(self):
+        """测试翻页错位的一轮不移动游标，下一轮完整补齐游标之后的事件"""
+        import asyncio
+        from fnos import EventLogger
+
+        ids = [5, 4, 3, 2, 1]
+        state = {"broken": True}
+
+        async def fake_common_list(timeout=10.0, offset=0, limit=20, **kwargs):
+            if offset > 0 and state["broken"]:
+                # 第一轮的第二页与第一页重复
+                state["broken"] = False
+                offset = 0
+            rows = [{"id": event_id} for event_id in ids[offset:offset + limit]]
+            return {"result": "succ", "data": {"total": len(ids), "rows": rows}}
+
+        async def run_test():
+            event_logger = EventLogger(FnosClient())
+            event_logger.common_list = fake_common_list
+            received = []
+
+            async def consume():
+                async for event in event_logger.tail(since_id=1, interval=0.01, page_size=2):
+                    received.append(event["id"])
+                    if len(received) == 4:
+                        break
+
+            await asyncio.wait_for(consume(), timeout=2.0)
+            self.assertEqual(received, [2, 3, 4, 5])
+
+        asyncio.run(run_test())
+
+    def test_tail_raises_when_bootstrap_fails(self):
+        """测试获取最新事件失败时tail抛出异常，而不是从id 0开始重放整个日志"""
+        import asyncio
+        from fnos import EventLogger
+
+        ids = list(range(50, 0, -1))
+        calls = []
+
+        async def fake_common_list(timeout=10.0, offset=0, limit=20, **kwargs):
+            calls.append((offset, limit))
+            if len(calls) == 1:
+                return {"result": "fail", "errno": 1}
+            rows = [{"id": event_id} for event_id in ids[offset:offset + limit]]
+            return {"result": "succ", "data": {"total": len(ids), "rows": rows}}
+
+        async def run_test():
+            event_logger = EventLogger(FnosClient())
+            event_logger.common_list = fake_common_list
+
+            with self.assertRaises(Exception):
+                async for _ in event_logger.tail(interval=0.01):
+                    self.fail("不应产出任何事件")
+            self.assertEqual(calls, [(0, 1)])
+
+            # 成功获取后从最新的事件之后开始，不重放历史事件
+            received = []
+
+            async def consume():
+                async for event in event_logger.tail(interval=0.01, page_size=10):
+                    received.append(event["id"])
+                    break
+
+            task = asyncio.create_task(consume())
+            await asyncio.sleep(0.05)
+            ids.insert(0, 52)
+            await asyncio.wait_for(task, timeout=2.0)
+            self.assertEqual(received, [52])
+
+        asyncio.run(run_test())
+
+    def test_event_store_incomplete_sync_keeps_position(self):
+        """测试翻页错位时EventStore.sync不更新同步位置，下次同步补齐"""
+        import asyncio
+        from fnos import EventStore
+
+        ids = list(range(25, 0, -1))
+        state = {"broken": True}
+
+        async def fake_common_list(timeout=10.0, offset=0, limit=20, **kwargs):
+            if offset > 0 and state["broken"]:
+                # 服务器重复返回第一页
+                offset = 0
+            rows = [{"id": event_id, "content": f"event {event_id}"} for event_id in ids[offset:offset + limit]]
+            return {"result": "succ", "data": {"total": len(ids), "rows": rows}}
+
+        async def run_test():
+            store = EventStore(FnosClient(), ":memory:")
+            store.event_logger.common_list = fake_common_list
+            try:
+                stats = await store.sync(page_size=10)
+                self.assertFalse(stats["complete"])
+                self.assertEqual(stats["synced_id"], 0)
+                self.assertEqual(store.count(), 10)
+
+                state["broken"] = False
+                stats = await store.sync(page_size=10)
+                self.assertTrue(stats["complete"])
+                self.assertEqual(stats["synced_id"], 25)
+                self.assertEqual(stats["inserted"], 15)
+                self.assertEqual(store.count(), 25)
+            finally:
+                store.close()
+
+        asyncio.run(run_test())
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,117 @@
+import math
+import unittest
+from fnos import CounterRate, AnomalyDetector, ContainerStatsHistory
+
+
+def net_response(receive, transmit=0):
+    """构造ResourceMonitor.net()格式的返回结果"""
+    return {"result": "succ", "data": {"ifs": [{"name": "eth0", "receive": receive, "transmit": transmit}]}}
+
+
+class TestCounterRate(unittest.TestCase):
+    def test_first_sample_has_no_rate(self):
+        """测试设备第一次出现时速率为NaN"""
+        counter = CounterRate.for_net()
+        self.assertEqual(counter.update(net_response(1000), timestamp=0.0), 1)
+        self.assertTrue(math.isnan(counter.rate("eth0", "receive")))
+
+        counter.update(net_response(3000, 500), timestamp=10.0)
+        self.assertEqual(counter.rate("eth0", "receive"), 200.0)
+        self.assertEqual(counter.rate("eth0", "transmit"), 50.0)
+
+    def test_counter_wrap(self):
+        """测试计数器减小且降幅超过wrap的一半时按回绕计算"""
+        wrap = 2 ** 32
+        counter = CounterRate.for_net(wrap=wrap)
+        counter.update(net_response(wrap - 100), timestamp=0.0)
+        counter.update(net_response(100), timestamp=10.0)
+
+        # 回绕前后共增加了200
+        self.assertEqual(counter.rate("eth0", "receive"), 20.0)
+
+    def test_counter_reset(self):
+        """测试计数器减小且降幅不超过wrap的一半时按重置计算"""
+        counter = CounterRate.for_net(wrap=2 ** 32)
+        counter.update(net_response(10000), timestamp=0.0)
+        counter.update(net_response(50), timestamp=10.0)
+
+        # 重置后从0开始计数，本周期增加了50
+        self.assertEqual(counter.rate("eth0", "receive"), 5.0)
+        self.assertEqual(dict(counter.items()), {"eth0": (5.0, 0.0)})
+
+
+class TestAnomalyDetector(unittest.TestCase):
+    def warm_up(self, detector, metric="cpuBusy", count=20):
+        """输入在10和12之间交替的样本，使均值约为11、标准差约为1"""
+        for i in range(count):
+            self.assertEqual(detector.update({metric: 10.0 if i % 2 else 12.0}, timestamp=float(i)), [])
+
+    def test_zscore_breach_and_recover(self):
+        """测试z-score超过z_enter时告警，回落到z_exit以下时恢复"""
+        detector = AnomalyDetector(alpha=0.1, z_enter=3.0, z_exit=2.0, warmup=10)
+        self.warm_up(detector)
+
+        events = detector.update({"cpuBusy": 100.0}, timestamp=100.0)
+        self.assertEqual(len(events), 1)
+        event = events[0]
+        self.assertEqual(event["metric"], "cpuBusy")
+        self.assertEqual(event["type"], "breach")
+        self.assertEqual(event["reason"], "zscore")
+        self.assertGreaterEqual(event["z"], 3.0)
+        self.assertTrue(detector.state("cpuBusy")["active"])
+
+        events = detector.update({"cpuBusy": 11.0}, timestamp=101.0)
+        self.assertEqual([event["type"] for event in events], ["recover"])
+        self.assertLess(abs(events[0]["z"]), 2.0)
+        self.assertFalse(detector.state("cpuBusy")["active"])
+
+    def test_hysteresis_keeps_alert_between_thresholds(self):
+        """测试z-score介于z_exit和z_enter之间时保持告警，不重复产出事件"""
+        detector = AnomalyDetector(alpha=0.1, z_enter=3.0, z_exit=0.1, warmup=10)
+        self.warm_up(detector)
+
+        self.assertEqual([e["type"] for e in detector.update({"cpuBusy": 100.0}, timestamp=100.0)], ["breach"])
+        # 尖峰之后z-score明显回落，但仍未低于z_exit
+        self.assertEqual(detector.update({"cpuBusy": 30.0}, timestamp=101.0), [])
+        self.assertTrue(detector.state("cpuBusy")["active"])
+
+    def test_threshold_breach_and_recover(self):
+        """测试固定阈值的进入和退出"""
+        detector = AnomalyDetector(thresholds={"cpuBusy": (90, 80)})
+        events = detector.update({"cpuBusy": 95.0}, timestamp=0.0)
+        self.assertEqual([(e["type"], e["reason"]) for e in events], [("breach", "threshold")])
+        self.assertEqual(detector.update({"cpuBusy": 85.0}, timestamp=1.0), [])
+        self.assertEqual([e["type"] for e in detector.update({"cpuBusy": 70.0}, timestamp=2.0)], ["recover"])
+
+
+
+def stats_response(*container_ids):
+    """构造DockerManager.stats()格式的返回结果"""
+    return {"result": "succ", "rsp": {
+        container_id: {"cpuUsage": 1.0, "usedMem": 100, "networkRx": 0, "networkTx": 0}
+        for container_id in container_ids
+    }}
+
+
+class TestContainerStatsHistory(unittest.TestCase):
+    def test_removed_container_expires_by_default(self):
+        """测试默认配置下，长时间未出现的容器的历史会被删除"""
+        history = ContainerStatsHistory(capacity=10)
+        history.update(stats_response("a", "b"), timestamp=0.0)
+        history.update(stats_response("a"), timestamp=100.0)
+        self.assertIn("b", history)
+
+        history.update(stats_response("a"), timestamp=400.0)
+        self.assertIn("a", history)
+        self.assertNotIn("b", history)
+
+    def test_expire_disabled(self):
+        """测试expire_after为None时不自动删除"""
+        history = ContainerStatsHistory(capacity=10, expire_after=None)
+        history.update(stats_response("a", "b"), timestamp=0.0)
+        history.update(stats_response("a"), timestamp=10000.0)
+        self.assertIn("b", history)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, DockerManager, Network, ListDiffer
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_list_differ_containers():
+    """测试 ListDiffer 比较 DockerManager.list_containers() 结果的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_diff.py::test_list_differ_containers -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 DockerManager 实例
+        docker_mgr = DockerManager(client)
+        differ = ListDiffer.for_containers()
+
+        # 第一次所有容器都视为新增
+        first = await docker_mgr.list_containers()
+        changes = differ.update(first)
+        assert len(changes["added"]) == len(first["rsp"]), "第一次应全部视为新增"
+        assert changes["removed"] == [] and changes["changed"] == [], "第一次不应有删除或变化"
+
+        # 相同结果不应产生变化
+        assert ListDiffer.is_empty(differ.update(first)), "相同结果不应产生变化"
+
+        # 模拟删除一个容器并修改另一个容器的状态
+        if len(first["rsp"]) >= 2:
+            modified = [dict(item) for item in first["rsp"][1:]]
+            modified[0]["State"] = "changed-state"
+            changes = differ.update({"rsp": modified})
+            assert [item["Id"] for item in changes["removed"]] == [first["rsp"][0]["Id"]], "删除的容器不正确"
+            assert len(changes["changed"]) == 1, "应只有一个容器变化"
+            assert changes["changed"][0]["fields"] == {
+                "State": (first["rsp"][1]["State"], "changed-state")
+            }, "变化字段不正确"
+
+    finally:
+        # 清理连接
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_list_differ_interfaces():
+    """测试 ListDiffer 比较 Network.list() 结果的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_diff.py::test_list_differ_interfaces -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 Network 实例
+        network = Network(client)
+        differ = ListDiffer.for_interfaces()
+
+        result = await network.list(type=0)
+        changes = differ.update(result)
+        assert changes is not None, "找不到网络接口列表"
+        assert {item["name"] for item in changes["added"]} == {
+            item["name"] for item in result["data"]["net"]["ifs"]
+        }, "新增的网络接口不正确"
+
+        # 接口全部消失
+        changes = differ.update({"data": {"net": {"ifs": []}}})
+        assert len(changes["removed"]) == len(result["data"]["net"]["ifs"]), "删除的网络接口不正确"
+
+    finally:
+        # 清理连接
+        await client.close()
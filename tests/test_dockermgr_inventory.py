@@ -0,0 +1,87 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, DockerManager
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_dockermgr_inventory():
+    """测试 DockerManager.inventory() 方法的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_dockermgr_inventory.py -m integration
+    或：
+        pytest tests/test_dockermgr_inventory.py
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 DockerManager 实例
+        docker_mgr = DockerManager(client)
+
+        # 获取 Docker 清单
+        inventory = await docker_mgr.inventory()
+
+        # 与 list_containers 结果对照
+        containers_result = await docker_mgr.list_containers()
+        containers = containers_result.get("rsp", [])
+        assert len(inventory.containers) == len(containers), "容器数量不一致"
+
+        for item in containers:
+            container = inventory.container(item["Id"])
+            assert container is not None, f"找不到容器 {item['Id']}"
+            project = item.get("Project") or ""
+            assert container in inventory.containers_of_project(project), "容器所属项目不正确"
+            assert container in inventory.containers_of_image(item["Image"]), "容器所用镜像不正确"
+            for name in item.get("Names", []):
+                assert inventory.container(name) is container, "按名称查找结果不一致"
+
+        # 验证项目汇总
+        for project, totals in inventory.projects.items():
+            members = inventory.containers_of_project(project)
+            assert totals["containers"] == len(members), f"项目 {project} 容器数不正确"
+            assert totals["usedMem"] == sum(c.get("usedMem", 0) for c in members), f"项目 {project} 内存汇总不正确"
+
+        # 验证排序
+        ranked = inventory.top_projects("usedMem")
+        values = [totals["usedMem"] for _, totals in ranked]
+        assert values == sorted(values, reverse=True), "项目未按内存用量降序排列"
+
+        # 验证 Compose 项目索引
+        composes_result = await docker_mgr.list_composes()
+        for compose in composes_result.get("rsp", []):
+            assert compose["Name"] in inventory.composes, f"缺少 Compose 项目 {compose['Name']}"
+
+    finally:
+        # 清理连接
+        await client.close()
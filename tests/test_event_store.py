@@ -0,0 +1,84 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, EventLogger, EventStore
+
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_event_store_sync_and_search(tmp_path):
+    """测试 EventStore.sync()、search() 和 aggregate() 方法的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_event_store.py::test_event_store_sync_and_search -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+    store = None
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 EventStore 实例
+        store = EventStore(client, str(tmp_path / "events.db"))
+
+        # 首次同步
+        stats = await store.sync(page_size=200)
+        for key in ("fetched", "inserted", "complete", "synced_id"):
+            assert key in stats, f"统计结果缺少 {key} 字段"
+        assert stats["complete"], "首次同步应读完整个日志"
+        assert stats["inserted"] == store.count(), "写入数与事件总数不一致"
+
+        # 再次同步不应重复写入
+        again = await store.sync(page_size=200)
+        assert store.count() == stats["inserted"] + again["inserted"], "事件被重复写入"
+
+        # 与最新事件对照
+        latest = await EventLogger(client).common_list(offset=0, limit=1)
+        rows = latest["data"]["rows"]
+        if rows:
+            event = rows[0]
+            found = store.search(username=event["username"], since=event["eventtm"], until=event["eventtm"])
+            assert any(item["id"] == event["id"] for item in found), "按用户名和时间查询不到最新事件"
+            if len(event["content"]) >= 3:
+                found = store.search(text=event["content"])
+                assert any(item["id"] == event["id"] for item in found), "全文查询不到最新事件"
+
+        # 验证统计
+        by_level = store.aggregate("level")
+        assert sum(by_level.values()) == store.count(), "按级别统计的总数不正确"
+        with pytest.raises(ValueError):
+            store.aggregate("content")
+
+    finally:
+        # 清理
+        if store is not None:
+            store.close()
+        await client.close()
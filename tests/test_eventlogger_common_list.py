@@ -89,4 +89,142 @@ async def test_eventlogger_common_list():
 
     finally:
         # 清理连接
-        await client.close()
\ No newline at end of file
+        await client.close()
+
+@pytest.mark.asyncio
+async def test_eventlogger_common_list_paging():
+    """测试 EventLogger.common_list() 分页参数的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_eventlogger_common_list.py::test_eventlogger_common_list_paging -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 EventLogger 实例
+        event_logger = EventLogger(client)
+
+        # 获取前两页
+        first_page = await event_logger.common_list(offset=0, limit=2)
+        assert first_page.get("result") == "succ", "响应结果不是成功"
+        assert len(first_page["data"]["rows"]) <= 2, "返回行数超过 limit"
+
+        second_page = await event_logger.common_list(offset=2, limit=2)
+        assert second_page.get("result") == "succ", "响应结果不是成功"
+        first_ids = {event["id"] for event in first_page["data"]["rows"]}
+        second_ids = {event["id"] for event in second_page["data"]["rows"]}
+        assert not first_ids & second_ids, "两页的事件不应重复"
+
+        # 非法参数
+        with pytest.raises(ValueError):
+            await event_logger.common_list(limit=0)
+
+    finally:
+        # 清理连接
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_eventlogger_iter_events():
+    """测试 EventLogger.iter_events() 方法的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_eventlogger_common_list.py::test_eventlogger_iter_events -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 EventLogger 实例
+        event_logger = EventLogger(client)
+
+        # 以很小的页读取前若干条事件
+        events = []
+        async for event in event_logger.iter_events(page_size=2):
+            events.append(event)
+            if len(events) == 5:
+                break
+
+        ids = [event["id"] for event in events]
+        assert len(ids) == len(set(ids)), "事件不应重复"
+        for event in events:
+            assert "eventtm" in event, "事件缺少 eventtm 字段"
+
+    finally:
+        # 清理连接
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_eventlogger_tail(tmp_path):
+    """测试 EventLogger.tail() 方法的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_eventlogger_common_list.py::test_eventlogger_tail -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 EventLogger 实例
+        event_logger = EventLogger(client)
+
+        # 取最新的几条事件，以倒数第三条的 id 为游标
+        latest = await event_logger.common_list(offset=0, limit=3)
+        rows = latest["data"]["rows"]
+        if len(rows) < 3:
+            pytest.skip("事件数量不足")
+        since_id = rows[-1]["id"]
+
+        cursor_path = tmp_path / "cursor"
+        events = []
+        async for event in event_logger.tail(since_id, interval=0.1, cursor_path=str(cursor_path)):
+            events.append(event)
+            if len(events) == 2:
+                break
+
+        ids = [event["id"] for event in events]
+        assert ids == sorted(ids), "事件应按 id 升序产出"
+        assert all(event_id > since_id for event_id in ids), "不应产出游标之前的事件"
+        assert len(ids) == len(set(ids)), "事件不应重复"
+
+    finally:
+        # 清理连接
+        await client.close()
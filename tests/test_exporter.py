@@ -0,0 +1,80 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, PrometheusExporter
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_exporter_serve_metrics():
+    """测试 PrometheusExporter.serve() 方法的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_exporter.py -m integration
+    或：
+        pytest tests/test_exporter.py
+    """
+    # 创建客户端
+    client = FnosClient()
+    exporter = None
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 启动 exporter，监听随机端口
+        exporter = PrometheusExporter(client, intervals={"resmon": 1.0})
+        server = await exporter.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        # 抓取 /metrics
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET /metrics HTTP/1.1\r\nHost: 127.0.0.1\r\n\r\n")
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+
+        head, _, body = response.partition(b"\r\n\r\n")
+        assert head.startswith(b"HTTP/1.1 200"), f"响应状态错误: {head}"
+        text = body.decode("utf-8")
+        assert 'fnos_exporter_up{family="resmon"} 1.0' in text, "resmon 指标族刷新失败"
+        assert "fnos_cpu_busy_percent" in text, "缺少 fnos_cpu_busy_percent 指标"
+
+        # 其他路径返回 404
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET / HTTP/1.1\r\nHost: 127.0.0.1\r\n\r\n")
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        assert response.startswith(b"HTTP/1.1 404"), "非 /metrics 路径应返回 404"
+
+    finally:
+        # 清理
+        if exporter is not None:
+            await exporter.stop()
+        await client.close()
@@ -0,0 +1,82 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, File
+
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_file_du():
+    """测试 File.du() 方法的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_file_du.py::test_file_du -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 File 实例
+        file_obj = File(client)
+
+        # 找到第一个文件夹作为统计目录
+        default_list_result = await file_obj.list()
+        test_path = None
+        for file_item in default_list_result.get("files", []):
+            if "dir" in file_item:
+                test_path = f"vol{file_item.get('v', 1)}/1000/{file_item['name']}"
+                break
+        if test_path is None:
+            pytest.skip("没有找到文件夹进行du测试")
+
+        # 统计目录占用空间
+        usage = await file_obj.du(test_path)
+
+        # 验证根目录统计
+        assert test_path in usage, "结果缺少根目录"
+        root = usage.get(test_path)
+        assert root["size"] == usage.total, "根目录大小应该等于total"
+        assert root["size"] >= 0, "size 应该是非负数"
+        assert root["files"] >= 0, "files 应该是非负数"
+        assert root["dirs"] == len(usage) - 1, "dirs 应该等于子目录总数"
+
+        # 验证子目录大小不超过父目录
+        for child in usage.children(test_path):
+            assert usage.get(child)["size"] <= root["size"], "子目录大小不应超过父目录"
+
+        # 再次统计应得到相同结果
+        usage_again = await file_obj.du(test_path)
+        assert usage_again.total == usage.total, "重复统计结果不一致"
+
+    finally:
+        # 清理连接
+        await client.close()
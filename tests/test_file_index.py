@@ -0,0 +1,83 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, FileIndex
+
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_file_index_crawl_and_search(tmp_path):
+    """测试 FileIndex.crawl() 和 FileIndex.search() 方法的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_file_index.py::test_file_index_crawl_and_search -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+    index = None
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 FileIndex 实例
+        index = FileIndex(client, str(tmp_path / "index.db"))
+
+        # 抓取目录树
+        root = "vol1/1000"
+        stats = await index.crawl(root)
+
+        # 验证统计字段
+        for key in ("listed", "updated", "unchanged", "errors"):
+            assert key in stats, f"统计结果缺少 {key} 字段"
+            assert isinstance(stats[key], int), f"{key} 应该是整数"
+        assert stats["listed"] >= 1, "至少应该列出根目录"
+
+        # 验证全部条目都在根目录下
+        entries = index.search(under=root, limit=index.count() + 1)
+        assert len(entries) == index.count(), "条目数量不一致"
+        for entry in entries:
+            assert entry["path"].startswith(root + "/"), "条目路径不在根目录下"
+            assert entry["path"] == f"{entry['dir']}/{entry['name']}", "path 应该由 dir 和 name 组成"
+
+        # 验证前缀查询
+        if entries:
+            name = entries[0]["name"]
+            found = index.search(name_prefix=name[:1])
+            assert any(item["name"] == name for item in found), "前缀查询未找到条目"
+
+        # 再次抓取，未变化的目录应被跳过
+        stats_again = await index.crawl(root)
+        assert stats_again["updated"] <= stats["updated"], "重复抓取不应更新更多目录"
+
+    finally:
+        if index is not None:
+            index.close()
+        # 清理连接
+        await client.close()
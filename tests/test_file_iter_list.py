@@ -0,0 +1,69 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, File
+
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_file_iter_list_matches_list():
+    """测试 File.iter_list() 方法的集成测试（结果与 list() 一致）
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_file_iter_list.py::test_file_iter_list_matches_list -m integration
+    """
+    # 创建客户端，为大目录单独调大消息大小上限
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666", max_size=64 * 2 ** 20)
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 File 实例
+        file_obj = File(client)
+
+        # 分别用两种方式获取文件列表
+        list_result = await file_obj.list()
+        entries = [entry async for entry in file_obj.iter_list()]
+
+        # 验证结果一致
+        assert "files" in list_result, "响应缺少 files 字段"
+        assert entries == list_result["files"], "iter_list 结果与 list 不一致"
+
+        # 验证条目格式
+        for entry in entries:
+            assert isinstance(entry, dict), "条目应该是字典"
+            assert "name" in entry, "文件对象缺少 name 字段"
+
+        # 原始响应请求不应残留
+        assert not client.raw_response_reqids, "raw_response_reqids 应该为空"
+
+    finally:
+        # 清理连接
+        await client.close()
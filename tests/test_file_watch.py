@@ -0,0 +1,93 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+import pytest
+
+from fnos import FnosClient, File
+
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_file_watch_created():
+    """测试 File.watch() 方法的集成测试（新建文件夹产生 created 事件）
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_file_watch.py::test_file_watch_created -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+    watcher = None
+    next_event = None
+    test_path = None
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 File 实例
+        file_obj = File(client)
+
+        # 开始监视目录
+        watch_dir = "vol1/1000"
+        watcher = file_obj.watch(watch_dir, interval=0.5)
+        next_event = asyncio.ensure_future(watcher.__anext__())
+        # 等待初始状态建立
+        await asyncio.sleep(0.2)
+
+        # 创建一个测试文件夹
+        test_dir_name = f"test_watch_{int(time.time())}"
+        test_path = f"{watch_dir}/{test_dir_name}"
+        mkdir_result = await file_obj.mkdir(test_path)
+        assert mkdir_result.get("result") == "succ", "创建文件夹失败"
+
+        # 等待 created 事件
+        event = await asyncio.wait_for(next_event, timeout=10.0)
+        assert event["type"] == "created", f"事件类型不正确: {event}"
+        assert event["path"] == watch_dir, "事件目录不正确"
+        assert event["name"] == test_dir_name, "事件文件名不正确"
+        assert event["entry"]["name"] == test_dir_name, "事件条目不正确"
+
+    finally:
+        # 清理：停止监视并删除测试文件夹
+        if next_event is not None and not next_event.done():
+            next_event.cancel()
+        if watcher is not None:
+            await watcher.aclose()
+        if test_path is not None:
+            await File(client).remove([test_path], move_to_trashbin=False)
+        # 清理连接
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_file_watch_empty_paths():
+    """测试 File.watch() 方法使用空路径参数"""
+    file_obj = File(FnosClient())
+
+    with pytest.raises(ValueError, match="paths参数不能为空"):
+        await file_obj.watch([]).__anext__()
@@ -197,3 +197,40 @@ async def test_iscsi_manager_list_targets():
 
     finally:
         await client.close()
+
+
+@pytest.mark.asyncio
+async def test_iscsi_manager_topology():
+    """测试 IscsiManager.topology() 方法的集成测试"""
+    client = FnosClient()
+
+    try:
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        iscsi = IscsiManager(client)
+
+        topology = await iscsi.topology(concurrency=2)
+
+        # 与 list_luns 结果对照
+        luns_result = await iscsi.list_luns()
+        luns = luns_result["data"]["luns"]
+        assert len(topology.luns) == len(luns), "LUN 数量不一致"
+        for lun in luns:
+            assert topology.lun(lun["lunName"]) is topology.lun(lun["wwn"]), "按名称和 WWN 查找结果不一致"
+            usergroups = topology.usergroups_of_lun(lun["lunName"])
+            assert not isinstance(usergroups, Exception), f"获取 LUN 用户组失败: {usergroups}"
+            assert "permState" in usergroups, "LUN 用户组缺少 permState 字段"
+
+        # 与 list_targets 结果对照
+        targets_result = await iscsi.list_targets()
+        for target in targets_result["data"]["targets"]:
+            assert topology.target(target["iqn"]) is topology.target(target["targetName"]), "按 IQN 和名称查找结果不一致"
+            for lun in topology.luns_of_target(target["iqn"]):
+                assert topology.target(target["iqn"]) in topology.targets_of_lun(lun["lunName"]), "LUN 反向索引不正确"
+
+    finally:
+        await client.close()
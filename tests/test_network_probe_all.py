@@ -0,0 +1,72 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, Network
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_network_probe_all():
+    """测试 Network.probe_all() 方法的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_network_probe_all.py -m integration
+    或：
+        pytest tests/test_network_probe_all.py
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 Network 实例
+        network = Network(client)
+
+        # 探测所有接口
+        topology = await network.probe_all(concurrency=2)
+
+        # 与 list(type=0) 结果对照
+        list_result = await network.list(type=0)
+        for item in list_result["data"]["net"]["ifs"]:
+            assert item["name"] in topology, f"缺少网络接口 {item['name']}"
+            entry = topology[item["name"]]
+            assert entry["type0"]["name"] == item["name"], "type0 条目不正确"
+            detect = entry["detect"]
+            assert not isinstance(detect, Exception), f"检测网络接口失败: {detect}"
+            assert detect.get("result") == "succ", "检测结果不是成功"
+            assert "ifs" in detect["data"], "检测结果缺少 ifs 字段"
+
+        # 缓存有效期内返回同一结果
+        assert await network.probe_all() is topology, "缓存有效期内应返回缓存的结果"
+        assert await network.probe_all(refresh=True) is not topology, "refresh=True 应重新获取"
+
+    finally:
+        # 清理连接
+        await client.close()
@@ -0,0 +1,67 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, Notify
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_notify_watch_unread():
+    """测试 Notify.watch_unread() 方法的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_notify_watch_unread.py -m integration
+    或：
+        pytest tests/test_notify_watch_unread.py
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 Notify 实例
+        notify = Notify(client)
+        expected = (await notify.unread_total())["unreadTotal"]
+
+        # 两个监视者共享一个订阅，都应先收到当前的未读总数
+        first = notify.watch_unread(poll_interval=1.0)
+        second = notify.watch_unread(poll_interval=1.0)
+        assert await asyncio.wait_for(first.__anext__(), 5) == expected, "第一个监视者收到的未读总数不正确"
+        assert await asyncio.wait_for(second.__anext__(), 5) == expected, "第二个监视者收到的未读总数不正确"
+        assert len(client.push_listeners) == 1, "多个监视者应共享一个订阅"
+
+        # 全部监视者退出后取消订阅
+        await first.aclose()
+        await second.aclose()
+        assert client.push_listeners == [], "监视者退出后应取消订阅"
+
+    finally:
+        # 清理连接
+        await client.close()
@@ -0,0 +1,92 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import asyncio
+import pytest
+
+from fnos import FnosClient, ResourceMonitor
+
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+async def _collect_rates(kind: str, fields: tuple):
+    """采样两次并验证速率引擎的结果"""
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 ResourceMonitor 实例
+        resource_monitor = ResourceMonitor(client)
+
+        count = 0
+        engine = None
+        async for engine in resource_monitor.rates(kind, 0.5):
+            count += 1
+            if count == 2:
+                break
+
+        # 验证引擎状态
+        assert engine.fields == fields, "计数器字段不正确"
+        assert len(engine.rates) == len(engine.names) * len(fields), "速率数组长度不正确"
+
+        # 第二次采样后每个设备都应有非负速率
+        for name, rates in engine.items():
+            assert len(rates) == len(fields), "速率元组长度不正确"
+            for field, value in zip(fields, rates):
+                assert not math.isnan(value), f"{name}.{field} 速率不应为 NaN"
+                assert value >= 0, f"{name}.{field} 速率应该是非负数"
+                assert engine.rate(name, field) == value, "rate() 结果不一致"
+
+    finally:
+        # 清理连接
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_resmon_rates_net():
+    """测试 ResourceMonitor.rates("net") 方法的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_resource_monitor_rates.py::test_resmon_rates_net -m integration
+    """
+    await _collect_rates("net", ("receive", "transmit"))
+
+
+@pytest.mark.asyncio
+async def test_resmon_rates_disk():
+    """测试 ResourceMonitor.rates("disk") 方法的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_resource_monitor_rates.py::test_resmon_rates_disk -m integration
+    """
+    await _collect_rates("disk", ("read", "write"))
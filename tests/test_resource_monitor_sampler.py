@@ -0,0 +1,76 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, ResourceMonitor
+
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_resmon_sampler():
+    """测试 ResourceMonitor.sampler() 方法的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_resource_monitor_sampler.py::test_resmon_sampler -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 ResourceMonitor 实例
+        resource_monitor = ResourceMonitor(client)
+
+        # 采集若干个样本
+        interval = 0.5
+        samples = []
+        async for sample in resource_monitor.sampler(interval, items=["cpuBusy", "memPercent"]):
+            samples.append(sample)
+            if len(samples) == 3:
+                break
+
+        # 验证样本格式
+        for sample in samples:
+            assert sample["error"] is None, f"采样失败: {sample['error']}"
+            assert sample["data"].get("result") == "succ", "响应结果不是成功"
+            assert "cpuBusy" in sample["data"]["data"]["item"], "item 响应缺少 cpuBusy 字段"
+            assert sample["received"] >= sample["sent"], "接收时间不应早于发送时间"
+            assert sample["latency"] >= 0, "latency 应该是非负数"
+
+        # 验证采样时刻按固定频率递增，不累积漂移
+        for previous, current in zip(samples, samples[1:]):
+            assert current["tick"] == previous["tick"] + 1 + current["skipped"], "tick 序号不连续"
+        elapsed = samples[-1]["sent"] - samples[0]["sent"]
+        expected = (samples[-1]["tick"] - samples[0]["tick"]) * interval
+        assert abs(elapsed - expected) < interval / 2, "采样时刻漂移过大"
+
+    finally:
+        # 清理连接
+        await client.close()
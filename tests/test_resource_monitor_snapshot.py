@@ -0,0 +1,83 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, ResourceMonitor
+
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_resmon_snapshot_all():
+    """测试 ResourceMonitor.snapshot() 方法的集成测试（全部组件）
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_resource_monitor_snapshot.py::test_resmon_snapshot_all -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 ResourceMonitor 实例
+        resource_monitor = ResourceMonitor(client)
+
+        # 获取完整快照
+        snapshot = await resource_monitor.snapshot(deadline=5.0)
+
+        # 验证结果格式
+        for key in ("data", "latency", "errors", "missing", "elapsed"):
+            assert key in snapshot, f"快照缺少 {key} 字段"
+
+        # 每个组件必须且只能出现在 data、errors、missing 之一
+        components = ("cpu", "gpu", "memory", "disk", "net", "ups")
+        for name in components:
+            places = [name in snapshot["data"], name in snapshot["errors"], name in snapshot["missing"]]
+            assert places.count(True) == 1, f"组件 {name} 状态不正确"
+
+        # 验证成功组件的响应和耗时
+        for name, response in snapshot["data"].items():
+            assert response.get("result") == "succ", f"{name} 响应结果不是成功: {response}"
+            assert 0 <= snapshot["latency"][name] <= snapshot["elapsed"], f"{name} 耗时不合理"
+
+        # 快照总耗时不应超过截止时间太多
+        assert snapshot["elapsed"] < 5.0 + 1.0, "快照耗时超过截止时间"
+
+    finally:
+        # 清理连接
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_resmon_snapshot_invalid_component():
+    """测试 ResourceMonitor.snapshot() 方法使用不支持的组件"""
+    resource_monitor = ResourceMonitor(FnosClient())
+
+    with pytest.raises(ValueError, match="不支持的组件"):
+        await resource_monitor.snapshot(components=("cpu", "fan"))
@@ -0,0 +1,96 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, SAC
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_sac_watch_ups():
+    """测试 SAC.watch_ups() 方法的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_sac_watch_ups.py::test_sac_watch_ups -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 SAC 实例
+        sac = SAC(client)
+        watcher = sac.watch_ups(interval=0.2, battery_interval=0.1)
+
+        # 第一个事件是当前状态
+        event = await asyncio.wait_for(watcher.__anext__(), 5)
+        assert event["previous"] is None, "第一个事件的 previous 应为 None"
+        assert event["state"]["reachable"], "应能获取 UPS 状态"
+        for field in ("reachable", "enabled", "online", "on_battery", "charge_band"):
+            assert field in event["changed"], f"第一个事件应包含 {field}"
+
+        # 状态不变时不应产出事件
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(watcher.__anext__(), 1)
+        await watcher.aclose()
+
+    finally:
+        # 清理连接
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_sac_watch_ups_many():
+    """测试 SAC.watch_ups_many() 方法的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_sac_watch_ups.py::test_sac_watch_ups_many -m integration
+    """
+    clients = [FnosClient(), FnosClient()]
+
+    try:
+        for client in clients:
+            await client.connect("127.0.0.1:5666")
+            assert client.connected, "连接失败"
+            login_result = await client.login("admin", "admin")
+            assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 每台主机都应先产出一次当前状态
+        watcher = SAC.watch_ups_many([SAC(client) for client in clients], interval=0.2)
+        events = [await asyncio.wait_for(watcher.__anext__(), 5) for _ in clients]
+        assert all(event["previous"] is None for event in events), "每台主机的第一个事件应为当前状态"
+        await watcher.aclose()
+
+    finally:
+        for client in clients:
+            await client.close()
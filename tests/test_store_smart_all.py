@@ -0,0 +1,80 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, Store
+
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_store_smart_all():
+    """测试 Store.smart_all() 方法的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_store_smart_all.py::test_store_smart_all -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 Store 实例
+        store = Store(client)
+
+        # 获取全部磁盘名称
+        disks_result = await store.list_disks(no_hot_spare=False)
+        assert "disk" in disks_result, "响应缺少 disk 字段"
+        disk_names = [disk["name"] for disk in disks_result["disk"]]
+        if not disk_names:
+            pytest.skip("系统中没有可用的磁盘")
+
+        # 并发获取所有磁盘 SMART 信息
+        smart_results = await store.smart_all()
+
+        # 验证结果以磁盘名称为键
+        assert list(smart_results.keys()) == disk_names, "结果的键应该与磁盘列表一致"
+        for disk_name, smart_result in smart_results.items():
+            assert isinstance(smart_result, dict), f"{disk_name} 查询失败: {smart_result}"
+            assert smart_result.get("result") == "succ", f"响应结果不是成功: {smart_result}"
+            assert "smart" in smart_result, "响应缺少 smart 字段"
+
+        # 再次获取应命中缓存，返回相同结果
+        cached_results = await store.smart_all()
+        for disk_name in disk_names:
+            assert cached_results[disk_name] is smart_results[disk_name], "结果应该来自缓存"
+
+        # 强制刷新应重新查询
+        refreshed_results = await store.smart_all(refresh=True)
+        for disk_name in disk_names:
+            assert refreshed_results[disk_name] is not smart_results[disk_name], "refresh 应该重新查询"
+
+    finally:
+        # 清理连接
+        await client.close()
@@ -0,0 +1,84 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, Store
+
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_store_topology():
+    """测试 Store.topology() 方法的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_store_topology.py::test_store_topology -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 Store 实例
+        store = Store(client)
+
+        # 获取存储拓扑
+        topology = await store.topology()
+
+        # 验证存储空间信息
+        assert topology.space.get("result") == "succ", "stor.calcSpace 响应结果不是成功"
+
+        # 与 general 结果对照
+        general_result = await store.general()
+        array_data = general_result.get("array", [])
+        assert len(topology.volumes) == len(array_data), "存储空间数量不一致"
+
+        for item in array_data:
+            # 按名称和 UUID 查找应得到同一对象
+            volume = topology.volume(item["name"])
+            assert volume is not None, f"找不到存储空间 {item['name']}"
+            assert topology.volume(item["uuid"]) is volume, "按 UUID 查找结果不一致"
+            assert "md" in volume, "存储空间缺少 md 字段"
+
+            # 验证 RAID 阵列反向索引
+            for pool in volume["md"]:
+                assert topology.pool(pool["name"]) is pool, "按名称查找阵列结果不一致"
+                assert topology.pool(pool["uuid"]) is pool, "按 UUID 查找阵列结果不一致"
+                assert topology.volume_of_pool(pool["name"]) is volume, "阵列所属存储空间不正确"
+                for member in pool.get("disk", []):
+                    assert pool in topology.pools_of_disk(member["name"]), "磁盘所在阵列不正确"
+                    assert volume in topology.volumes_of_disk(member["name"]), "磁盘所在存储空间不正确"
+
+        # 验证磁盘索引
+        for disk_name, disk in topology.disks.items():
+            assert disk["name"] == disk_name, "磁盘索引键不正确"
+
+    finally:
+        # 清理连接
+        await client.close()
@@ -0,0 +1,79 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, ResourceMonitor, AnomalyDetector
+
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_anomaly_detector_with_sampler():
+    """测试 AnomalyDetector 处理 ResourceMonitor 采样结果的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_timeseries_anomaly_detector.py::test_anomaly_detector_with_sampler -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 ResourceMonitor 实例
+        resource_monitor = ResourceMonitor(client)
+
+        # memPercent 总是不小于 -1，第一个样本必然触发阈值告警，之后不应重复告警
+        detector = AnomalyDetector(thresholds={"memPercent": (-1, -2)})
+
+        events = []
+        count = 0
+        async for sample in resource_monitor.sampler(0.2, items=["cpuBusy", "memPercent"]):
+            assert sample["error"] is None, f"采样失败: {sample['error']}"
+            events.extend(detector.update_general(sample["data"], sample["sent"]))
+            count += 1
+            if count == 3:
+                break
+
+        # 验证阈值告警只在进入时产出一次
+        mem_events = [event for event in events if event["metric"] == "memPercent"]
+        assert len(mem_events) == 1, f"memPercent 告警事件数量不正确: {mem_events}"
+        assert mem_events[0]["type"] == "breach", "事件类型应该是 breach"
+        assert mem_events[0]["reason"] == "threshold", "告警原因应该是 threshold"
+
+        # 验证 EWMA 状态
+        state = detector.state("cpuBusy")
+        assert state is not None, "缺少 cpuBusy 状态"
+        assert state["count"] == 3, "样本数不正确"
+        assert 0 <= state["mean"] <= 100, "cpuBusy 均值应该在 0-100 之间"
+        assert state["std"] >= 0, "标准差应该是非负数"
+        assert detector.state("memPercent")["active"], "memPercent 应该处于告警中"
+
+    finally:
+        # 清理连接
+        await client.close()
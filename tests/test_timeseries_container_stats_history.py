@@ -0,0 +1,80 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, DockerManager, ContainerStatsHistory
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_container_stats_history():
+    """测试 ContainerStatsHistory 处理 DockerManager.stats() 结果的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_timeseries_container_stats_history.py -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 DockerManager 实例
+        docker_mgr = DockerManager(client)
+
+        history = ContainerStatsHistory(10)
+        history.set_projects(await docker_mgr.list_containers())
+
+        # 采集两次统计信息
+        first = await docker_mgr.stats()
+        history.update(first, 100.0)
+        second = await docker_mgr.stats()
+        history.update(second, 101.0)
+        assert len(history) == 2, "应该保存了 2 个样本"
+
+        for container_id, stats in second["rsp"].items():
+            assert container_id in history, f"缺少容器 {container_id} 的历史"
+            timestamps, values = history.series(container_id, "usedMem")
+            assert list(timestamps)[-1] == 101.0, "最新样本时间戳错误"
+            assert values[-1] == stats["usedMem"], "usedMem 与统计结果不一致"
+            if container_id in first["rsp"]:
+                rx = history.latest(container_id)["networkRx"]
+                assert rx != rx or rx >= 0, "networkRx 速率应该是非负数"
+
+        # 按项目汇总的内存之和应等于各容器之和
+        rollup = history.project_latest()
+        total = sum(project["usedMem"] for project in rollup.values())
+        assert total == sum(stats["usedMem"] for stats in second["rsp"].values()), "项目汇总结果错误"
+
+        # 过期后历史应被删除
+        removed = history.expire(102.0)
+        assert set(removed) == set(second["rsp"]) | set(first["rsp"]), "过期的容器不正确"
+
+    finally:
+        # 清理连接
+        await client.close()
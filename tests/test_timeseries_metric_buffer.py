@@ -0,0 +1,82 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, ResourceMonitor, MetricBuffer
+
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_metric_buffer_with_sampler():
+    """测试 MetricBuffer 保存 ResourceMonitor 采样结果的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_timeseries_metric_buffer.py::test_metric_buffer_with_sampler -m integration
+    """
+    # 创建客户端
+    client = FnosClient()
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 ResourceMonitor 实例，容量小于样本数以验证覆盖
+        resource_monitor = ResourceMonitor(client)
+        buffer = MetricBuffer(capacity=3)
+
+        count = 0
+        async for sample in resource_monitor.sampler(0.2):
+            assert sample["error"] is None, f"采样失败: {sample['error']}"
+            buffer.append_general(sample["data"], sample["sent"])
+            count += 1
+            if count == 5:
+                break
+
+        # 验证只保留最新的 capacity 个样本
+        assert len(buffer) == 3, "缓冲区长度应该等于容量"
+        timestamps, values = buffer.window("cpuBusy")
+        assert len(timestamps) == 3, "时间戳数量不正确"
+        assert list(timestamps) == sorted(timestamps), "时间戳应该递增"
+
+        # 验证统计结果
+        stats = buffer.stats("cpuBusy", percentiles=(50, 95))
+        assert stats["count"] == 3, "有效样本数不正确"
+        assert 0 <= stats["min"] <= stats["mean"] <= stats["max"] <= 100, "统计值不合理"
+        assert stats["min"] <= stats["p50"] <= stats["p95"] <= stats["max"], "百分位数不合理"
+
+        # 验证按时间范围查询
+        latest = buffer.stats("memPercent", since=timestamps[-1])
+        assert latest["count"] == 1, "时间范围查询结果不正确"
+
+        # 验证降采样：样本跨度很短，一小时的桶最多跨越两个
+        bucket_times, bucket_values = buffer.downsample("cpuBusy", bucket=3600)
+        assert 1 <= len(bucket_values) <= 2, "降采样桶数量不正确"
+
+    finally:
+        # 清理连接
+        await client.close()
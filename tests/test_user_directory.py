@@ -0,0 +1,78 @@
+# Copyright 2025 Timandes White
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+from fnos import FnosClient, User, UserDirectory
+
+# 集成测试标记，用于区分需要外部依赖的测试
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_user_directory():
+    """测试 UserDirectory 的集成测试
+
+    此测试需要：
+    1. fnOS 服务运行在 127.0.0.1:5666
+    2. 使用 admin/admin 账户可以登录
+
+    运行方式：
+        pytest tests/test_user_directory.py -m integration
+    或：
+        pytest tests/test_user_directory.py
+    """
+    # 创建客户端
+    client = FnosClient()
+    directory = None
+
+    try:
+        # 连接到 fnOS 服务
+        await client.connect("127.0.0.1:5666")
+        assert client.connected, "连接失败"
+
+        # 登录
+        login_result = await client.login("admin", "admin")
+        assert login_result.get("result") == "succ", f"登录失败: {login_result}"
+
+        # 创建 UserDirectory 实例并加载
+        directory = UserDirectory(client, ttl=60.0)
+        assert directory.stale, "加载前索引应视为过期"
+        await directory.start()
+        assert not directory.stale, "加载后索引不应过期"
+
+        # 与 User 接口结果对照
+        user = User(client)
+        user_groups = await user.listUserGroups()
+        group_users = await user.groupUsers()
+
+        for item in user_groups["users"]:
+            assert directory.get_user(item["uid"])["user"] == item["user"], "按 uid 查找用户结果不正确"
+            assert directory.get_user(item["user"])["uid"] == item["uid"], "按用户名查找用户结果不正确"
+
+        for group in group_users["groups"]:
+            assert directory.get_group(group["gid"]) is not None, f"找不到组 {group['gid']}"
+            members = set(group.get("users") or [])
+            assert {u["uid"] for u in directory.users_of(group["group"])} <= members, "组中的用户不正确"
+            for uid in members:
+                assert directory.is_member(uid, group["gid"]), "成员关系判断不正确"
+                if directory.get_user(uid) is not None:
+                    assert group["gid"] in {g["gid"] for g in directory.groups_of(uid)}, "用户所属的组不正确"
+
+    finally:
+        # 清理
+        if directory is not None:
+            await directory.stop()
+        await client.close()